@@ -30,7 +30,7 @@ def register_research_agent() -> ResearchAgent:
     Returns:
         Configured ResearchAgent instance.
     """
-    from src.orchestration.discovery import AgentRegistry, AgentCard
+    from src.orchestration.discovery import AgentCard, get_registry
 
     agent = ResearchAgent()
 
@@ -64,7 +64,7 @@ def register_research_agent() -> ResearchAgent:
         },
     )
 
-    registry = AgentRegistry()
+    registry = get_registry()
     registry.register_card(card)
     registry.register_agent("research", agent)
 
@@ -38,6 +38,9 @@ from src.api.routes.reports import router as reports_router
 from src.api.routes.schedules import router as schedules_router
 from src.api.routes.onboarding import router as onboarding_router
 from src.config.settings import get_settings
+from src.knowledge.neo4j_client import close_shared_drivers
+from src.knowledge.reranker import RerankerService
+from src.monitoring.logging_config import configure_logging
 from src.scheduler.scheduler import Scheduler
 
 logger = structlog.get_logger(__name__)
@@ -133,9 +136,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Handles startup and shutdown events:
     - Startup: Initialize database connections, start scheduler, enable hot reload
-    - Shutdown: Stop scheduler, stop config watcher, cleanup resources
+    - Shutdown: Stop scheduler, stop config watcher, close Neo4j pool, cleanup resources
     """
     # Startup
+    configure_logging()
     logger.info("application_starting")
     set_server_start_time()
 
@@ -186,6 +190,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error("scheduler_shutdown_error", error=str(e))
 
+    # Close the shared Neo4j connection pool
+    try:
+        await close_shared_drivers()
+    except Exception as e:
+        logger.error("neo4j_shutdown_error", error=str(e))
+
+    # Close the shared Cohere rerank clients
+    try:
+        await RerankerService.aclose_all()
+    except Exception as e:
+        logger.error("reranker_shutdown_error", error=str(e))
+
     reset_dependencies()
     logger.info("application_stopped")
 
@@ -33,6 +33,18 @@ class Settings(BaseSettings):
     # -------------------------------------------------------------------------
     supabase_url: str = Field(..., description="Supabase project URL")
     supabase_key: SecretStr = Field(..., description="Supabase anon or service key")
+    supabase_max_connections: int = Field(
+        default=20,
+        description="Max HTTP connections in the scheduler's Supabase pool",
+    )
+    supabase_max_keepalive_connections: int = Field(
+        default=10,
+        description="Idle HTTP connections the scheduler keeps open to Supabase",
+    )
+    supabase_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle pooled Supabase connection is kept before closing",
+    )
 
     # -------------------------------------------------------------------------
     # Neo4j (Knowledge Graph)
@@ -40,6 +52,22 @@ class Settings(BaseSettings):
     neo4j_uri: str = Field(..., description="Neo4j connection URI (bolt://)")
     neo4j_user: str = Field(..., description="Neo4j username")
     neo4j_password: SecretStr = Field(..., description="Neo4j password")
+    neo4j_database: str = Field(
+        default="neo4j",
+        description="Neo4j database name (always passed explicitly to skip home-database lookup)",
+    )
+    neo4j_pool_size: int = Field(
+        default=100,
+        description="Max connections in the shared Neo4j driver pool",
+    )
+    neo4j_acquire_timeout: float = Field(
+        default=60.0,
+        description="Seconds to wait for a free pooled Neo4j connection",
+    )
+    neo4j_max_connection_lifetime: int = Field(
+        default=3600,
+        description="Seconds before a pooled Neo4j connection is recycled",
+    )
 
     # -------------------------------------------------------------------------
     # Pinecone (Vector Store)
@@ -49,6 +77,10 @@ class Settings(BaseSettings):
         default="localpulse-reviews",
         description="Pinecone index name",
     )
+    pinecone_pool_size: int = Field(
+        default=64,
+        description="Worker threads for blocking Pinecone SDK calls",
+    )
 
     # -------------------------------------------------------------------------
     # OpenAI (Embeddings)
@@ -16,6 +16,10 @@ Usage:
     async def call_google_places():
         ...
 
+    # Or as a context manager:
+    async with breaker.guard():
+        result = await call_api()
+
     # Or manual usage:
     if breaker.can_execute():
         try:
@@ -28,6 +32,8 @@ Usage:
 
 import asyncio
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
@@ -192,6 +198,39 @@ class CircuitBreaker:
                     message="Too many failures, circuit opened",
                 )
 
+    @asynccontextmanager
+    async def guard(
+        self,
+        open_error: Optional[Callable[[float], Exception]] = None,
+    ) -> AsyncIterator[None]:
+        """
+        Guard a block of code with this circuit breaker.
+
+        Checks the circuit on enter and records success or failure on exit,
+        re-raising any exception from the block.
+
+        Args:
+            open_error: Builds the exception raised when the circuit is open,
+                given the seconds until recovery. Defaults to
+                CircuitBreakerOpenError.
+
+        Raises:
+            CircuitBreakerOpenError: If the circuit is open and no open_error
+                factory was given.
+        """
+        if not self.can_execute():
+            recovery_time = self.time_until_recovery()
+            if open_error is not None:
+                raise open_error(recovery_time)
+            raise CircuitBreakerOpenError(self.name, recovery_time)
+
+        try:
+            yield
+        except Exception:
+            await self.record_failure()
+            raise
+        await self.record_success()
+
     def reset(self) -> None:
         """Reset circuit breaker to closed state."""
         self._state = CircuitState.CLOSED
@@ -205,17 +244,8 @@ class CircuitBreaker:
 
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            if not self.can_execute():
-                recovery_time = self.time_until_recovery()
-                raise CircuitBreakerOpenError(self.name, recovery_time)
-
-            try:
-                result = await func(*args, **kwargs)
-                await self.record_success()
-                return result
-            except Exception as e:
-                await self.record_failure()
-                raise
+            async with self.guard():
+                return await func(*args, **kwargs)
 
         return wrapper
 
@@ -88,6 +88,7 @@ class DependencyContainer:
                     uri=self._settings.neo4j_uri,
                     user=self._settings.neo4j_user,
                     password=self._settings.neo4j_password.get_secret_value(),
+                    database=self._settings.neo4j_database,
                 )
                 logger.info("neo4j_client_created")
             except Exception as e:
@@ -172,7 +173,7 @@ class DependencyContainer:
 
             # Initialize Pinecone
             self.pinecone.connect()
-            self.pinecone.ensure_index()
+            await self.pinecone.ensure_index()
             logger.info("pinecone_connected")
 
             # Embeddings service doesn't need explicit init
@@ -205,7 +206,10 @@ class DependencyContainer:
         # Close Neo4j
         if self._neo4j is not None:
             try:
+                from src.knowledge.neo4j_client import close_shared_drivers
+
                 await self._neo4j.close()
+                await close_shared_drivers()
                 logger.info("neo4j_closed")
             except Exception as e:
                 logger.error("neo4j_close_error", error=str(e))
@@ -463,6 +463,7 @@ async def fetch_data(state: AnalysisState) -> dict:
             results = await client.run_query(
                 business_query,
                 {"business_id": business_id},
+                read_only=True,
             )
 
             if not results or not results[0].get("business"):
@@ -480,6 +481,7 @@ async def fetch_data(state: AnalysisState) -> dict:
                 results = await client.run_query(
                     name_query,
                     {"search_term": business_id},
+                    read_only=True,
                 )
 
             if not results or not results[0].get("business"):
@@ -441,7 +441,7 @@ async def store_embeddings(state: CollectionState) -> dict:
         embeddings_service = EmbeddingsService()
         pinecone_client = PineconeClient()
         pinecone_client.connect()
-        pinecone_client.ensure_index()
+        await pinecone_client.ensure_index()
 
         # Extract review texts
         review_texts = [r.get("text", "") for r in reviews if r.get("text")]
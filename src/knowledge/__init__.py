@@ -29,6 +29,7 @@ Example:
 
 from src.knowledge.neo4j_client import (
     Neo4jClient,
+    PreparedQuery,
     create_sample_business,
     create_sample_location,
     initialize_schema,
@@ -59,6 +60,7 @@ from src.knowledge.reranker import (
 __all__ = [
     # Neo4j
     "Neo4jClient",
+    "PreparedQuery",
     "initialize_schema",
     "create_sample_business",
     "create_sample_location",
@@ -15,9 +15,15 @@ from typing import Any
 
 import cohere
 import structlog
+from cohere.errors import (
+    GatewayTimeoutError,
+    InternalServerError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
+)
 from tenacity import (
     retry,
-    retry_if_exception,
+    retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
@@ -30,10 +36,14 @@ logger = structlog.get_logger(__name__)
 _executor = ThreadPoolExecutor(max_workers=4)
 
 
-def _is_retryable(exception: BaseException) -> bool:
-    """Check if exception should trigger retry."""
-    error_str = str(exception).lower()
-    return any(keyword in error_str for keyword in ["rate", "limit", "timeout", "unavailable"])
+# Transient Cohere failures worth retrying (rate limits, server errors, timeouts)
+_RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (
+    TooManyRequestsError,
+    InternalServerError,
+    ServiceUnavailableError,
+    GatewayTimeoutError,
+    asyncio.TimeoutError,
+)
 
 
 class CohereEmbeddingsService:
@@ -118,7 +128,7 @@ class CohereEmbeddingsService:
         return response.embeddings.float_
 
     @retry(
-        retry=retry_if_exception(_is_retryable),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
         wait=wait_exponential(multiplier=1, min=1, max=60),
         stop=stop_after_attempt(5),
         before_sleep=lambda retry_state: logger.warning(
@@ -146,7 +156,7 @@ class CohereEmbeddingsService:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         embeddings = await loop.run_in_executor(
             _executor,
             lambda: self._embed_sync([text], input_type),
@@ -161,7 +171,7 @@ class CohereEmbeddingsService:
         return embedding
 
     @retry(
-        retry=retry_if_exception(_is_retryable),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
         wait=wait_exponential(multiplier=1, min=1, max=60),
         stop=stop_after_attempt(5),
         before_sleep=lambda retry_state: logger.warning(
@@ -185,7 +195,7 @@ class CohereEmbeddingsService:
         Returns:
             List of embedding vectors.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             _executor,
             lambda: self._embed_sync(texts, input_type),
@@ -211,37 +221,26 @@ class CohereEmbeddingsService:
         if not texts:
             return []
 
-        # Filter empty texts and track indices
-        valid_texts: list[tuple[int, str]] = [
-            (i, t) for i, t in enumerate(texts) if t and t.strip()
-        ]
+        # Filter empty texts
+        valid_texts: list[str] = [t for t in texts if t and t.strip()]
 
         if not valid_texts:
             raise ValueError("All texts are empty")
 
-        # Process in batches
-        all_embeddings: list[tuple[int, list[float]]] = []
+        # Process in batches; batches are sequential so appending preserves order
+        result: list[list[float]] = []
         effective_batch_size = min(batch_size, self.MAX_BATCH_SIZE)
 
         for i in range(0, len(valid_texts), effective_batch_size):
-            batch = valid_texts[i : i + effective_batch_size]
-            batch_indices = [idx for idx, _ in batch]
-            batch_texts = [text for _, text in batch]
+            batch_texts = valid_texts[i : i + effective_batch_size]
 
             logger.debug(
                 "cohere_embedding_batch_processing",
                 batch_num=i // effective_batch_size + 1,
-                batch_size=len(batch),
+                batch_size=len(batch_texts),
             )
 
-            embeddings = await self._embed_batch_request(batch_texts, input_type)
-
-            for idx, embedding in zip(batch_indices, embeddings):
-                all_embeddings.append((idx, embedding))
-
-        # Sort by original index and extract embeddings
-        all_embeddings.sort(key=lambda x: x[0])
-        result = [emb for _, emb in all_embeddings]
+            result.extend(await self._embed_batch_request(batch_texts, input_type))
 
         logger.info(
             "cohere_embedding_batch_completed",
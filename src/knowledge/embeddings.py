@@ -147,37 +147,26 @@ class EmbeddingsService:
         if not texts:
             return []
 
-        # Filter empty texts and track indices
-        valid_texts: list[tuple[int, str]] = [
-            (i, t) for i, t in enumerate(texts) if t and t.strip()
-        ]
+        # Filter empty texts
+        valid_texts: list[str] = [t for t in texts if t and t.strip()]
 
         if not valid_texts:
             raise ValueError("All texts are empty")
 
-        # Process in batches
-        all_embeddings: list[tuple[int, list[float]]] = []
+        # Process in batches; batches are sequential so appending preserves order
+        result: list[list[float]] = []
         effective_batch_size = min(batch_size, self.MAX_BATCH_SIZE)
 
         for i in range(0, len(valid_texts), effective_batch_size):
-            batch = valid_texts[i : i + effective_batch_size]
-            batch_indices = [idx for idx, _ in batch]
-            batch_texts = [text for _, text in batch]
+            batch_texts = valid_texts[i : i + effective_batch_size]
 
             logger.debug(
                 "embedding_batch_processing",
                 batch_num=i // effective_batch_size + 1,
-                batch_size=len(batch),
+                batch_size=len(batch_texts),
             )
 
-            embeddings = await self._embed_batch_request(batch_texts)
-
-            for idx, embedding in zip(batch_indices, embeddings):
-                all_embeddings.append((idx, embedding))
-
-        # Sort by original index and extract embeddings
-        all_embeddings.sort(key=lambda x: x[0])
-        result = [emb for _, emb in all_embeddings]
+            result.extend(await self._embed_batch_request(batch_texts))
 
         logger.info(
             "embedding_batch_completed",
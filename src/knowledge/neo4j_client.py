@@ -8,11 +8,21 @@ knowledge graph. Implements the context manager pattern for safe resource handli
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import copy
+import hashlib
+import logging
+import re
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 import structlog
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import AsyncGraphDatabase, AsyncDriver, RoutingControl
 from neo4j.exceptions import ServiceUnavailable, AuthError, Neo4jError
 
 from src.config import settings
@@ -23,12 +33,184 @@ from src.core.exceptions import (
     KnowledgeStoreQueryError,
 )
 
-logger = structlog.get_logger(__name__)
+logger = structlog.get_logger(__name__, component="neo4j")
 
 # Circuit breaker for Neo4j operations
 _neo4j_breaker = get_circuit_breaker("neo4j", failure_threshold=5, recovery_timeout=60)
 
 
+def _circuit_open_error(recovery_time: float) -> KnowledgeStoreError:
+    """Build the error raised while the Neo4j circuit breaker is open."""
+    logger.warning("neo4j_circuit_open", recovery_time=recovery_time)
+    return KnowledgeStoreError(
+        f"Neo4j circuit breaker open. Recovery in {recovery_time:.1f}s",
+        {"recovery_time": recovery_time},
+    )
+
+
+# Shared empty parameter map for parameterless queries (never mutated)
+_EMPTY_PARAMS: dict[str, Any] = {}
+
+# Fingerprints of distinct query texts seen by this process. A well-behaved
+# app has a small fixed set; unbounded growth means values are being inlined
+# into query strings, which defeats the server's plan cache.
+_seen_fingerprints: set[str] = set()
+# Raw query texts already fingerprinted. str caches its hash, so a repeated
+# query costs one set probe instead of a normalize-and-hash
+_seen_queries: set[str] = set()
+_FINGERPRINT_LIMIT = 1000
+_COMMENT_LINE_RE = re.compile(r"^\s*//.*$", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _cypher_fingerprint(query: str) -> str:
+    """Hash a query with // comment lines dropped and whitespace normalized."""
+    normalized = _WHITESPACE_RE.sub(" ", _COMMENT_LINE_RE.sub("", query)).strip()
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+
+def _track_query_fingerprint(query: str) -> None:
+    """Log the first sighting of each distinct query, and warn on runaway growth."""
+    if query in _seen_queries or len(_seen_fingerprints) > _FINGERPRINT_LIMIT:
+        return
+    if len(_seen_queries) <= _FINGERPRINT_LIMIT:
+        _seen_queries.add(query)
+    fingerprint = _cypher_fingerprint(query)
+    if fingerprint in _seen_fingerprints:
+        return
+    _seen_fingerprints.add(fingerprint)
+    logger.debug(
+        "neo4j_new_query_fingerprint",
+        fingerprint=fingerprint,
+        query=query[:100],
+        distinct_queries=len(_seen_fingerprints),
+    )
+    if len(_seen_fingerprints) > _FINGERPRINT_LIMIT:
+        logger.warning(
+            "neo4j_query_fingerprints_exceeded",
+            limit=_FINGERPRINT_LIMIT,
+            message="Too many distinct queries; pass values as parameters, not in the query string",
+        )
+
+
+# Last formatted UTC timestamp as (monotonic time, ISO string)
+_ts_cache: tuple[float, str] = (0.0, "")
+
+
+def _now_iso_cached(resolution: float = 0.1) -> str:
+    """
+    Get the current UTC time as an ISO string, reusing it within a window.
+
+    Rows written in the same burst share one timestamp instead of building
+    and formatting a new datetime each time.
+
+    Args:
+        resolution: Seconds a formatted timestamp stays valid.
+
+    Returns:
+        ISO 8601 UTC timestamp, at most resolution seconds old.
+    """
+    global _ts_cache
+    now = time.monotonic()
+    cached_at, cached = _ts_cache
+    if cached and now - cached_at < resolution:
+        return cached
+    cached = datetime.now(timezone.utc).isoformat()
+    _ts_cache = (now, cached)
+    return cached
+
+
+@dataclass
+class _SharedDriver:
+    """A verified shared driver and whether schema init has run on it."""
+
+    driver: AsyncDriver
+    schema_ready: bool = False
+
+
+# Process-wide drivers, one per event loop and credential set. A driver owns a
+# connection pool and is expensive to create, so every Neo4jClient shares it.
+# Only drivers that passed verify_connectivity() are registered.
+_shared_drivers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str, str], _SharedDriver]
+] = weakref.WeakKeyDictionary()
+
+# Serializes driver creation, verification and schema init per event loop
+_shared_driver_locks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Lock
+] = weakref.WeakKeyDictionary()
+
+
+def _shared_driver_lock() -> asyncio.Lock:
+    """Get the shared-driver lock for the running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _shared_driver_locks.get(loop)
+    if lock is None:
+        lock = _shared_driver_locks[loop] = asyncio.Lock()
+    return lock
+
+
+def _new_driver(uri: str, user: str, password: str) -> AsyncDriver:
+    """Build a driver with the pool configured from settings."""
+    return AsyncGraphDatabase.driver(
+        uri,
+        auth=(user, password),
+        max_connection_pool_size=settings.neo4j_pool_size,
+        connection_acquisition_timeout=settings.neo4j_acquire_timeout,
+        max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+        keep_alive=True,
+    )
+
+
+async def close_shared_drivers() -> None:
+    """
+    Close all shared Neo4j drivers for the running event loop.
+
+    Call once at application shutdown; Neo4jClient.close() only releases
+    its reference so other clients keep using the pool.
+    """
+    async with _shared_driver_lock():
+        drivers = _shared_drivers.pop(asyncio.get_running_loop(), {})
+        for shared in drivers.values():
+            await shared.driver.close()
+    if drivers:
+        logger.info("neo4j_shared_drivers_closed", count=len(drivers))
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    """
+    A fixed, parameter-only Cypher query.
+
+    The server caches execution plans by exact query text, whitespace
+    included, so the query is normalized to single spaces on construction.
+    Two call sites with different indentation then share one plan, and
+    values can only be passed as parameters, never inlined.
+
+    Only use for queries without whitespace-sensitive string literals.
+
+    Attributes:
+        cypher: Normalized Cypher query string.
+        required: Parameter names that must be supplied on every run.
+    """
+
+    cypher: str
+    required: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cypher", " ".join(self.cypher.split()))
+        object.__setattr__(self, "required", frozenset(self.required))
+
+
+# Bulk upsert: one MERGE per row, all rows of a chunk in one transaction
+_UPSERT_BUSINESSES_QUERY = """
+UNWIND $rows AS row
+MERGE (b:Business {id: row.id})
+SET b += row
+"""
+_UPSERT_CHUNK_SIZE = 1000
+
+
 class Neo4jClient:
     """
     Async Neo4j client with connection management.
@@ -36,6 +218,12 @@ class Neo4jClient:
     Usage:
         async with Neo4jClient() as client:
             result = await client.run_query("MATCH (n) RETURN n LIMIT 10")
+
+    Each query runs in its own session (driver-managed for run_query and
+    run_write_query). Sessions are cheap (they borrow a connection from the
+    driver's pool, so no TCP/TLS/Bolt handshake is repeated) and are not safe
+    for concurrent use, so they are deliberately not cached and shared across
+    coroutines.
     """
 
     def __init__(
@@ -43,6 +231,9 @@ class Neo4jClient:
         uri: str | None = None,
         user: str | None = None,
         password: str | None = None,
+        database: str | None = None,
+        cache_max_size: int = 256,
+        cache_ttl_seconds: float = 30.0,
     ) -> None:
         """
         Initialize the Neo4j client.
@@ -51,17 +242,32 @@ class Neo4jClient:
             uri: Neo4j connection URI. Defaults to settings.neo4j_uri.
             user: Neo4j username. Defaults to settings.neo4j_user.
             password: Neo4j password. Defaults to settings.neo4j_password.
+            database: Default database for queries. Defaults to settings.neo4j_database.
+            cache_max_size: Max entries in the opt-in read query result cache.
+            cache_ttl_seconds: Seconds a cached read result stays valid.
         """
         self._uri = uri or settings.neo4j_uri
         self._user = user or settings.neo4j_user
         self._password = password or settings.neo4j_password.get_secret_value()
+        # Always passed to sessions; omitting it costs an extra home-database lookup
+        self.default_database = database or settings.neo4j_database
         self._driver: AsyncDriver | None = None
 
+        # Opt-in LRU + TTL cache for read queries (see run_query(cache=True))
+        self._result_cache: OrderedDict[tuple[Any, ...], tuple[float, list[dict[str, Any]]]] = (
+            OrderedDict()
+        )
+        self._cache_max_size = cache_max_size
+        self._cache_ttl = cache_ttl_seconds
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     async def connect(self, auto_init_schema: bool = True) -> None:
         """Establish connection to Neo4j database.
 
         Args:
-            auto_init_schema: Initialize schema (constraints/indexes) on first connect.
+            auto_init_schema: Initialize schema (constraints/indexes) if no
+                earlier client has done so on the shared driver.
 
         Raises:
             KnowledgeStoreConnectionError: If connection fails.
@@ -69,44 +275,63 @@ class Neo4jClient:
         if self._driver is not None:
             return
 
-        try:
-            self._driver = AsyncGraphDatabase.driver(
-                self._uri,
-                auth=(self._user, self._password),
-            )
-            # Verify connectivity
-            await self._driver.verify_connectivity()
-            logger.info("neo4j_connected", uri=self._uri)
-
-            # Auto-initialize schema on first connect
-            if auto_init_schema:
-                await self._initialize_schema()
-
-        except AuthError as e:
-            logger.error("neo4j_auth_failed", error=str(e), uri=self._uri)
-            raise KnowledgeStoreConnectionError(
-                f"Neo4j authentication failed: {e}",
-                {"uri": self._uri, "original_error": str(e)},
-            )
-        except ServiceUnavailable as e:
-            logger.error("neo4j_unavailable", error=str(e), uri=self._uri)
-            raise KnowledgeStoreConnectionError(
-                f"Neo4j service unavailable: {e}",
-                {"uri": self._uri, "original_error": str(e)},
-            )
-        except KnowledgeStoreConnectionError:
-            raise
-        except Exception as e:
-            logger.error(
-                "neo4j_connection_failed",
-                error=str(e),
-                error_type=type(e).__name__,
-                uri=self._uri,
-            )
-            raise KnowledgeStoreConnectionError(
-                f"Failed to connect to Neo4j: {e}",
-                {"uri": self._uri, "original_error": str(e)},
-            )
+        key = (self._uri, self._user, self._password)
+        # Held across verification and schema init, so concurrent clients wait
+        # for a ready driver instead of receiving one that may still fail.
+        async with _shared_driver_lock():
+            drivers = _shared_drivers.setdefault(asyncio.get_running_loop(), {})
+            shared = drivers.get(key)
+            created = shared is None
+            driver = _new_driver(*key) if created else shared.driver
+            connected = False
+            try:
+                if created:
+                    # Verify connectivity
+                    await driver.verify_connectivity()
+                    logger.info("neo4j_connected", uri=self._uri)
+                    shared = drivers[key] = _SharedDriver(driver)
+
+                # Auto-initialize schema once per shared driver
+                if auto_init_schema and not shared.schema_ready:
+                    self._driver = driver
+                    await self._initialize_schema()
+                    shared.schema_ready = True
+                connected = True
+
+            except AuthError as e:
+                logger.error("neo4j_auth_failed", error=str(e), uri=self._uri)
+                raise KnowledgeStoreConnectionError(
+                    f"Neo4j authentication failed: {e}",
+                    {"uri": self._uri, "original_error": str(e)},
+                )
+            except ServiceUnavailable as e:
+                logger.error("neo4j_unavailable", error=str(e), uri=self._uri)
+                raise KnowledgeStoreConnectionError(
+                    f"Neo4j service unavailable: {e}",
+                    {"uri": self._uri, "original_error": str(e)},
+                )
+            except KnowledgeStoreConnectionError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "neo4j_connection_failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    uri=self._uri,
+                )
+                raise KnowledgeStoreConnectionError(
+                    f"Failed to connect to Neo4j: {e}",
+                    {"uri": self._uri, "original_error": str(e)},
+                )
+            finally:
+                if connected:
+                    self._driver = driver
+                else:
+                    self._driver = None
+                    if created:
+                        # Nobody else can hold it yet; don't leave it registered
+                        drivers.pop(key, None)
+                        await driver.close()
 
     async def _initialize_schema(self) -> None:
         """Initialize schema with constraints and indexes.
@@ -116,40 +341,48 @@ class Neo4jClient:
         """
         logger.info("neo4j_schema_auto_init_starting")
 
-        statements = [
-            stmt.strip()
-            for stmt in SCHEMA_CONSTRAINTS.strip().split(";")
-            if stmt.strip() and not stmt.strip().startswith("//")
-        ]
-
         initialized_count = 0
-        for statement in statements:
-            if statement:
+        existing_count = 0
+        failed_count = 0
+        # Use one direct session for all statements (avoids per-statement session
+        # setup and the circuit breaker). Sessions are not safe for concurrent
+        # use, so statements run sequentially on it.
+        async with self._driver.session(database=self.default_database) as session:
+            for statement in _SCHEMA_STATEMENTS:
                 try:
-                    # Use direct session to avoid circuit breaker during init
-                    async with self._driver.session(database="neo4j") as session:
-                        await session.run(statement)
+                    result = await session.run(statement)
+                    await result.consume()
                     initialized_count += 1
                 except Exception as e:
-                    # Constraints may already exist, log and continue
-                    logger.debug(
-                        "neo4j_schema_item_skipped",
+                    if _schema_rule_exists(e):
+                        existing_count += 1
+                        continue
+                    # Log real failures but keep going so one bad rule doesn't block startup
+                    failed_count += 1
+                    logger.warning(
+                        "neo4j_schema_item_failed",
                         statement=statement[:50],
                         reason=str(e),
                     )
 
         logger.info(
             "neo4j_schema_auto_init_complete",
-            total_statements=len(statements),
+            total_statements=len(_SCHEMA_STATEMENTS),
             initialized=initialized_count,
+            existing=existing_count,
+            failed=failed_count,
         )
 
     async def close(self) -> None:
-        """Close the Neo4j driver connection."""
+        """
+        Release this client's reference to the shared driver.
+
+        The driver's connection pool stays open for other clients; use
+        close_shared_drivers() at application shutdown to close it.
+        """
         if self._driver is not None:
-            await self._driver.close()
             self._driver = None
-            logger.info("neo4j_disconnected")
+            logger.debug("neo4j_client_released")
 
     async def __aenter__(self) -> Neo4jClient:
         """Async context manager entry."""
@@ -167,19 +400,63 @@ class Neo4jClient:
             raise RuntimeError("Neo4j client not connected. Use 'async with' or call connect().")
         return self._driver
 
+    def _cache_lookup(self, key: tuple[Any, ...]) -> list[dict[str, Any]] | None:
+        """Return a copy of a fresh cached result, or None on miss/expiry."""
+        entry = self._result_cache.get(key)
+        if entry is not None:
+            stored_at, records = entry
+            if time.monotonic() - stored_at < self._cache_ttl:
+                self._result_cache.move_to_end(key)
+                self._cache_hits += 1
+                logger.debug(
+                    "neo4j_cache_hit",
+                    hits=self._cache_hits,
+                    misses=self._cache_misses,
+                )
+                return copy.deepcopy(records)
+            # Expired, remove from cache
+            del self._result_cache[key]
+        self._cache_misses += 1
+        return None
+
+    def _cache_store(self, key: tuple[Any, ...], records: list[dict[str, Any]]) -> None:
+        """Cache a read result, evicting the least recently used entry if full."""
+        self._result_cache[key] = (time.monotonic(), copy.deepcopy(records))
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._cache_max_size:
+            self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached read results."""
+        self._result_cache.clear()
+
     async def run_query(
         self,
         query: str,
         parameters: dict[str, Any] | None = None,
-        database: str = "neo4j",
+        database: str | None = None,
+        cache: bool = False,
+        read_only: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Execute a Cypher query and return results.
 
+        Pass values through parameters rather than formatting them into the
+        query string: the server caches execution plans by exact query text.
+
+        Runs through driver.execute_query, which retries transient errors and
+        keeps reads causally consistent with earlier writes via bookmarks.
+
         Args:
             query: Cypher query string.
             parameters: Query parameters.
-            database: Target database name.
+            database: Target database name. Defaults to default_database.
+            cache: Serve/store the result in the client-side LRU + TTL cache.
+                Only use for read-only queries. run_write_query and any
+                run_query with read_only=False invalidate the cache, so pair
+                cache=True with read_only=True.
+            read_only: Route the query to a reader in a cluster. Only set for
+                queries that do not write.
 
         Returns:
             List of records as dictionaries.
@@ -188,68 +465,233 @@ class Neo4jClient:
             KnowledgeStoreError: If circuit breaker is open.
             KnowledgeStoreQueryError: If query fails.
         """
-        # Check circuit breaker
-        if not _neo4j_breaker.can_execute():
-            recovery_time = _neo4j_breaker.time_until_recovery()
-            logger.warning("neo4j_circuit_open", recovery_time=recovery_time)
-            raise KnowledgeStoreError(
-                f"Neo4j circuit breaker open. Recovery in {recovery_time:.1f}s",
-                {"recovery_time": recovery_time},
-            )
+        if parameters is None:
+            parameters = _EMPTY_PARAMS
+        _track_query_fingerprint(query)
 
-        try:
-            async with self.driver.session(database=database) as session:
-                result = await session.run(query, parameters or {})
-                records = await result.data()
-                await _neo4j_breaker.record_success()
-                logger.debug("neo4j_query_executed", query=query[:100], record_count=len(records))
-                return records
-
-        except ServiceUnavailable as e:
-            await _neo4j_breaker.record_failure()
-            logger.error("neo4j_service_unavailable", query=query[:100], error=str(e))
-            raise KnowledgeStoreQueryError(
-                f"Neo4j service unavailable: {e}",
-                {"query": query[:100], "original_error": str(e)},
-            )
-        except Neo4jError as e:
-            await _neo4j_breaker.record_failure()
-            logger.error(
-                "neo4j_query_failed",
-                query=query[:100],
-                error=str(e),
-                error_type=type(e).__name__,
-            )
+        cache_key: tuple[Any, ...] | None = None
+        if cache:
+            try:
+                cache_key = (
+                    query,
+                    tuple(sorted(parameters.items())),
+                    database or self.default_database,
+                )
+                hash(cache_key)
+            except TypeError:
+                # Unhashable parameter values (lists, maps) - skip caching
+                cache_key = None
+            else:
+                cached = self._cache_lookup(cache_key)
+                if cached is not None:
+                    return cached
+
+        async with _neo4j_breaker.guard(_circuit_open_error):
+            try:
+                result = await self.driver.execute_query(
+                    query,
+                    parameters,
+                    routing_=RoutingControl.READ if read_only else RoutingControl.WRITE,
+                    database_=database or self.default_database,
+                )
+                records = [record.data() for record in result.records]
+
+            except ServiceUnavailable as e:
+                query_prefix = query[:100]
+                logger.error("neo4j_service_unavailable", query=query_prefix, exc_info=True)
+                raise KnowledgeStoreQueryError(
+                    f"Neo4j service unavailable: {e}",
+                    {"query": query_prefix, "original_error": str(e)},
+                )
+            except Neo4jError as e:
+                query_prefix = query[:100]
+                logger.error("neo4j_query_failed", query=query_prefix, exc_info=True)
+                raise KnowledgeStoreQueryError(
+                    f"Neo4j query failed: {e}",
+                    {"query": query_prefix, "original_error": str(e)},
+                )
+            except Exception as e:
+                query_prefix = query[:100]
+                logger.error("neo4j_query_error", query=query_prefix, exc_info=True)
+                raise KnowledgeStoreQueryError(
+                    f"Failed to execute Neo4j query: {e}",
+                    {"query": query_prefix, "original_error": str(e)},
+                )
+
+        if logger.is_enabled_for(logging.DEBUG):
+            # Checked first so the query slice is only built when it is logged
+            logger.debug("neo4j_query_executed", query=query[:100], record_count=len(records))
+        if not read_only:
+            # Routed to the writer, so it may have written (MERGE/SET via
+            # run_prepared and the collection graph); cached reads are stale
+            self._result_cache.clear()
+        if cache_key is not None:
+            self._cache_store(cache_key, records)
+        return records
+
+    async def run_prepared(
+        self,
+        prepared: PreparedQuery,
+        parameters: dict[str, Any] | None = None,
+        database: str | None = None,
+        cache: bool = False,
+        read_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a PreparedQuery after checking its required parameters.
+
+        Args:
+            prepared: Query to execute.
+            parameters: Query parameters.
+            database: Target database name. Defaults to default_database.
+            cache: Serve/store the result in the client-side cache.
+            read_only: Route the query to a reader in a cluster.
+
+        Returns:
+            List of records as dictionaries.
+
+        Raises:
+            KnowledgeStoreQueryError: If required parameters are missing or
+                the query fails.
+        """
+        missing = prepared.required.difference(parameters or _EMPTY_PARAMS)
+        if missing:
             raise KnowledgeStoreQueryError(
-                f"Neo4j query failed: {e}",
-                {"query": query[:100], "original_error": str(e)},
-            )
-        except Exception as e:
-            await _neo4j_breaker.record_failure()
-            logger.error(
-                "neo4j_query_error",
-                query=query[:100],
-                error=str(e),
-                error_type=type(e).__name__,
+                f"Missing query parameters: {', '.join(sorted(missing))}",
+                {"query": prepared.cypher[:100], "missing": sorted(missing)},
             )
-            raise KnowledgeStoreQueryError(
-                f"Failed to execute Neo4j query: {e}",
-                {"query": query[:100], "original_error": str(e)},
+        return await self.run_query(
+            prepared.cypher, parameters, database=database, cache=cache, read_only=read_only
+        )
+
+    async def run_many(
+        self,
+        queries: list[tuple[str, dict[str, Any] | None]],
+        database: str | None = None,
+        read_only: bool = False,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Execute independent queries concurrently.
+
+        Each query borrows its own pooled connection (a single session cannot
+        run queries concurrently), so total latency is roughly that of the
+        slowest query rather than the sum. Queries run in separate
+        transactions; only batch queries that do not depend on each other.
+
+        Args:
+            queries: (query, parameters) pairs.
+            database: Target database name. Defaults to default_database.
+            read_only: Route all queries to a reader in a cluster.
+
+        Returns:
+            One record list per query, in input order.
+
+        Raises:
+            KnowledgeStoreError: If circuit breaker is open.
+            KnowledgeStoreQueryError: If any query fails.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.run_query(query, parameters, database=database, read_only=read_only)
+                    for query, parameters in queries
+                )
             )
+        )
+
+    async def iter_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Execute a Cypher query and yield records one at a time.
+
+        Unlike run_query, records are never materialized into a list, so
+        memory stays bounded for large result sets and the first row is
+        available as soon as the server streams it.
+
+        Usage:
+            async for record in client.iter_query("MATCH (b:Business) RETURN b"):
+                ...
+
+        When stopping early, wrap the iterator in contextlib.aclosing() so the
+        session is released immediately rather than when the generator is
+        garbage collected.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            database: Target database name. Defaults to default_database.
+
+        Yields:
+            Records as dictionaries.
+
+        Raises:
+            KnowledgeStoreError: If circuit breaker is open.
+            KnowledgeStoreQueryError: If query fails.
+        """
+        async with _neo4j_breaker.guard(_circuit_open_error):
+            try:
+                async with self.driver.session(
+                    database=database or self.default_database
+                ) as session:
+                    result = await session.run(
+                        query, parameters if parameters is not None else _EMPTY_PARAMS
+                    )
+                    async for record in result:
+                        yield record.data()
+
+            except (ServiceUnavailable, Neo4jError) as e:
+                logger.error("neo4j_stream_failed", query=query[:100], exc_info=True)
+                raise KnowledgeStoreQueryError(
+                    f"Neo4j streaming query failed: {e}",
+                    {"query": query[:100], "original_error": str(e)},
+                )
+
+    async def run_query_json(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str | None = None,
+    ) -> bytes:
+        """
+        Execute a Cypher query and return the records as a JSON array.
+
+        For endpoints that send query results straight to the client:
+        records are streamed and encoded with orjson, skipping the json
+        module and a second pass over the result.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            database: Target database name. Defaults to default_database.
+
+        Returns:
+            UTF-8 encoded JSON array of records. Values orjson cannot encode
+            natively (e.g. Neo4j temporal types) are encoded as strings.
+
+        Raises:
+            KnowledgeStoreError: If circuit breaker is open.
+            KnowledgeStoreQueryError: If query fails.
+        """
+        records = [record async for record in self.iter_query(query, parameters, database)]
+        return orjson.dumps(records, default=str)
 
     async def run_write_query(
         self,
         query: str,
         parameters: dict[str, Any] | None = None,
-        database: str = "neo4j",
+        database: str | None = None,
     ) -> list[dict[str, Any]]:
         """
-        Execute a write transaction.
+        Execute a write query in a managed transaction on the cluster leader.
 
         Args:
             query: Cypher query string.
             parameters: Query parameters.
-            database: Target database name.
+            database: Target database name. Defaults to default_database.
 
         Returns:
             List of records as dictionaries.
@@ -258,57 +700,74 @@ class Neo4jClient:
             KnowledgeStoreError: If circuit breaker is open.
             KnowledgeStoreQueryError: If query fails.
         """
-        # Check circuit breaker
-        if not _neo4j_breaker.can_execute():
-            recovery_time = _neo4j_breaker.time_until_recovery()
-            logger.warning("neo4j_circuit_open", recovery_time=recovery_time)
-            raise KnowledgeStoreError(
-                f"Neo4j circuit breaker open. Recovery in {recovery_time:.1f}s",
-                {"recovery_time": recovery_time},
-            )
+        _track_query_fingerprint(query)
 
-        async def _write_tx(tx: AsyncSession) -> list[dict[str, Any]]:
-            result = await tx.run(query, parameters or {})
-            return await result.data()
+        async with _neo4j_breaker.guard(_circuit_open_error):
+            # Any write may change cached read results
+            self._result_cache.clear()
 
-        try:
-            async with self.driver.session(database=database) as session:
-                records = await session.execute_write(lambda tx: _write_tx(tx))
-                await _neo4j_breaker.record_success()
-                logger.debug("neo4j_write_executed", query=query[:100], record_count=len(records))
-                return records
+            try:
+                result = await self.driver.execute_query(
+                    query,
+                    parameters if parameters is not None else _EMPTY_PARAMS,
+                    routing_=RoutingControl.WRITE,
+                    database_=database or self.default_database,
+                )
+                records = [record.data() for record in result.records]
+
+            except ServiceUnavailable as e:
+                logger.error("neo4j_write_unavailable", query=query[:100], exc_info=True)
+                raise KnowledgeStoreQueryError(
+                    f"Neo4j service unavailable during write: {e}",
+                    {"query": query[:100], "original_error": str(e)},
+                )
+            except Neo4jError as e:
+                logger.error("neo4j_write_failed", query=query[:100], exc_info=True)
+                raise KnowledgeStoreQueryError(
+                    f"Neo4j write query failed: {e}",
+                    {"query": query[:100], "original_error": str(e)},
+                )
+            except Exception as e:
+                logger.error("neo4j_write_error", query=query[:100], exc_info=True)
+                raise KnowledgeStoreQueryError(
+                    f"Failed to execute Neo4j write: {e}",
+                    {"query": query[:100], "original_error": str(e)},
+                )
 
-        except ServiceUnavailable as e:
-            await _neo4j_breaker.record_failure()
-            logger.error("neo4j_write_unavailable", query=query[:100], error=str(e))
-            raise KnowledgeStoreQueryError(
-                f"Neo4j service unavailable during write: {e}",
-                {"query": query[:100], "original_error": str(e)},
-            )
-        except Neo4jError as e:
-            await _neo4j_breaker.record_failure()
-            logger.error(
-                "neo4j_write_failed",
-                query=query[:100],
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            raise KnowledgeStoreQueryError(
-                f"Neo4j write query failed: {e}",
-                {"query": query[:100], "original_error": str(e)},
-            )
-        except Exception as e:
-            await _neo4j_breaker.record_failure()
-            logger.error(
-                "neo4j_write_error",
-                query=query[:100],
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            raise KnowledgeStoreQueryError(
-                f"Failed to execute Neo4j write: {e}",
-                {"query": query[:100], "original_error": str(e)},
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("neo4j_write_executed", query=query[:100], record_count=len(records))
+        return records
+
+    async def upsert_businesses(
+        self,
+        rows: list[dict[str, Any]],
+        chunk_size: int = _UPSERT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Create or update Business nodes in bulk.
+
+        Each chunk is a single UNWIND write, so N rows cost N / chunk_size
+        round trips instead of N. Chunking keeps each transaction small.
+
+        Args:
+            rows: Business properties; each row must include "id". All other
+                keys are set on the node (None removes the property).
+            chunk_size: Rows per transaction.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            KnowledgeStoreError: If circuit breaker is open.
+            KnowledgeStoreQueryError: If a chunk fails. Earlier chunks stay
+                committed.
+        """
+        for start in range(0, len(rows), chunk_size):
+            await self.run_write_query(
+                _UPSERT_BUSINESSES_QUERY, {"rows": rows[start : start + chunk_size]}
             )
+        logger.debug("neo4j_businesses_upserted", count=len(rows))
+        return len(rows)
 
 
 # =============================================================================
@@ -347,6 +806,24 @@ CREATE CONSTRAINT theme_id IF NOT EXISTS FOR (t:Theme) REQUIRE t.id IS UNIQUE;
 CREATE CONSTRAINT theme_name IF NOT EXISTS FOR (t:Theme) REQUIRE t.name IS UNIQUE;
 """
 
+# Parsed once at import: comment lines dropped, then split into statements
+_SCHEMA_STATEMENTS: tuple[str, ...] = tuple(
+    stmt.strip()
+    for stmt in "\n".join(
+        line for line in SCHEMA_CONSTRAINTS.splitlines() if not line.strip().startswith("//")
+    ).split(";")
+    if stmt.strip()
+)
+
+# Max schema statements in flight during initialize_schema()
+_SCHEMA_INIT_CONCURRENCY = 4
+
+
+def _schema_rule_exists(error: BaseException) -> bool:
+    """Check whether a schema statement failed only because the rule already exists."""
+    code = getattr(error, "code", None) or str(error)
+    return "EquivalentSchemaRuleAlreadyExists" in code
+
 
 async def initialize_schema(client: Neo4jClient) -> None:
     """
@@ -361,23 +838,68 @@ async def initialize_schema(client: Neo4jClient) -> None:
     """
     logger.info("neo4j_schema_init_started")
 
-    # Split constraints into individual statements and execute
-    statements = [
-        stmt.strip()
-        for stmt in SCHEMA_CONSTRAINTS.strip().split(";")
-        if stmt.strip() and not stmt.strip().startswith("//")
-    ]
+    # Each run_query uses its own pooled session, so statements can be in flight
+    # together; bound concurrency so a small instance isn't flooded with DDL.
+    semaphore = asyncio.Semaphore(_SCHEMA_INIT_CONCURRENCY)
 
-    for statement in statements:
-        if statement:
+    async def _run(statement: str) -> str:
+        async with semaphore:
             try:
                 await client.run_query(statement)
-                logger.debug("neo4j_constraint_created", statement=statement[:50])
-            except Exception as e:
-                # Constraints may already exist, log and continue
-                logger.warning("neo4j_constraint_skipped", statement=statement[:50], reason=str(e))
+                return "created"
+            except KnowledgeStoreQueryError as e:
+                if _schema_rule_exists(e):
+                    return "exists"
+                raise
+
+    results = await asyncio.gather(
+        *(_run(statement) for statement in _SCHEMA_STATEMENTS),
+        return_exceptions=True,
+    )
+
+    failed_count = 0
+    for statement, result in zip(_SCHEMA_STATEMENTS, results):
+        if isinstance(result, BaseException):
+            failed_count += 1
+            logger.warning("neo4j_constraint_failed", statement=statement[:50], reason=str(result))
+
+    logger.info(
+        "neo4j_schema_init_completed",
+        constraint_count=len(_SCHEMA_STATEMENTS),
+        created=results.count("created"),
+        existing=results.count("exists"),
+        failed=failed_count,
+    )
+
+
+# =============================================================================
+# Sample Data
+# =============================================================================
+
+_SAMPLE_LOCATION_QUERY = PreparedQuery(
+    """
+    MERGE (l:Location {id: $location_id})
+    SET l.city = $city,
+        l.area = $area,
+        l.postcode = $postcode,
+        l.lat = $lat,
+        l.lng = $lng
+    WITH l
+    MATCH (b:Business {id: $business_id})
+    MERGE (b)-[r:LOCATED_IN]->(l)
+    RETURN b.name AS business, l.city AS city, l.area AS area
+    """,
+    required=frozenset({"location_id", "city", "area", "postcode", "lat", "lng", "business_id"}),
+)
 
-    logger.info("neo4j_schema_init_completed", constraint_count=len(statements))
+_VERIFY_SAMPLE_QUERY = PreparedQuery(
+    """
+    MATCH (b:Business)-[:LOCATED_IN]->(l:Location)
+    RETURN b.name AS business, b.cuisine_type AS cuisine,
+           l.city AS city, l.area AS area
+    LIMIT 5
+    """
+)
 
 
 async def create_sample_business(client: Neo4jClient) -> dict[str, Any]:
@@ -390,23 +912,8 @@ async def create_sample_business(client: Neo4jClient) -> dict[str, Any]:
     Returns:
         Created business node data.
     """
-    query = """
-    MERGE (b:Business {id: $id})
-    SET b.name = $name,
-        b.google_place_id = $google_place_id,
-        b.cuisine_type = $cuisine_type,
-        b.price_range = $price_range,
-        b.avg_rating = $avg_rating,
-        b.address = $address,
-        b.phone = $phone,
-        b.website = $website,
-        b.created_at = $created_at,
-        b.updated_at = $updated_at
-    RETURN b
-    """
-
-    now = datetime.utcnow().isoformat()
-    parameters = {
+    now = _now_iso_cached()
+    business = {
         "id": "sample_business_001",
         "name": "Sample Italian Restaurant",
         "google_place_id": "ChIJ_sample_place_id",
@@ -420,9 +927,9 @@ async def create_sample_business(client: Neo4jClient) -> dict[str, Any]:
         "updated_at": now,
     }
 
-    result = await client.run_query(query, parameters)
-    logger.info("neo4j_sample_business_created", business_id=parameters["id"])
-    return result[0] if result else {}
+    await client.upsert_businesses([business])
+    logger.info("neo4j_sample_business_created", business_id=business["id"])
+    return business
 
 
 async def create_sample_location(client: Neo4jClient, business_id: str) -> dict[str, Any]:
@@ -436,19 +943,6 @@ async def create_sample_location(client: Neo4jClient, business_id: str) -> dict[
     Returns:
         Created relationship data.
     """
-    query = """
-    MERGE (l:Location {id: $location_id})
-    SET l.city = $city,
-        l.area = $area,
-        l.postcode = $postcode,
-        l.lat = $lat,
-        l.lng = $lng
-    WITH l
-    MATCH (b:Business {id: $business_id})
-    MERGE (b)-[r:LOCATED_IN]->(l)
-    RETURN b.name AS business, l.city AS city, l.area AS area
-    """
-
     parameters = {
         "location_id": "loc_sf_downtown",
         "city": "San Francisco",
@@ -459,7 +953,7 @@ async def create_sample_location(client: Neo4jClient, business_id: str) -> dict[
         "business_id": business_id,
     }
 
-    result = await client.run_query(query, parameters)
+    result = await client.run_prepared(_SAMPLE_LOCATION_QUERY, parameters)
     logger.info("neo4j_sample_location_created", location_id=parameters["location_id"])
     return result[0] if result else {}
 
@@ -503,17 +997,12 @@ async def test_connection() -> None:
 
         # Query to verify
         print("\nVerifying data...")
-        verify_query = """
-        MATCH (b:Business)-[:LOCATED_IN]->(l:Location)
-        RETURN b.name AS business, b.cuisine_type AS cuisine,
-               l.city AS city, l.area AS area
-        LIMIT 5
-        """
-        results = await client.run_query(verify_query)
         print("[OK] Query results:")
-        for record in results:
+        async for record in client.iter_query(_VERIFY_SAMPLE_QUERY.cypher):
             print(f"  - {record['business']} ({record['cuisine']}) in {record['city']}, {record['area']}")
 
+    await close_shared_drivers()
+
     print("\n" + "=" * 60)
     print("Test completed successfully!")
     print("=" * 60)
@@ -8,8 +8,10 @@ semantic search layer. Uses Cohere embed-v3 (1024 dimensions).
 from __future__ import annotations
 
 import asyncio
+import functools
 import time
-from typing import Any, TypedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence, TypedDict, TypeVar
 
 import structlog
 from pinecone import Pinecone, ServerlessSpec
@@ -25,9 +27,20 @@ from src.core.exceptions import (
 
 logger = structlog.get_logger(__name__)
 
+# Unwrapped once at import; settings are loaded once per process anyway
+_PINECONE_API_KEY = settings.pinecone_api_key.get_secret_value()
+
 # Circuit breaker for Pinecone operations
 _pinecone_breaker = get_circuit_breaker("pinecone", failure_threshold=5, recovery_timeout=60)
 
+# Thread pool for the sync Pinecone SDK, sized for I/O-bound calls rather
+# than the default executor's min(32, cpu_count + 4)
+_executor = ThreadPoolExecutor(
+    max_workers=settings.pinecone_pool_size, thread_name_prefix="pinecone"
+)
+
+T = TypeVar("T")
+
 
 # =============================================================================
 # Metadata Schema
@@ -49,10 +62,25 @@ class VectorRecord(TypedDict):
     """Vector record for upsert operations."""
 
     id: str
-    values: list[float]
+    values: Sequence[float]
     metadata: dict[str, Any]
 
 
+def _to_wire_record(record: VectorRecord) -> VectorRecord:
+    """
+    Convert array-like values (e.g. a float32 ndarray) to a plain list.
+
+    The REST SDK JSON-encodes values, so arrays must become lists; tolist()
+    does that in one C-level pass. Records that already hold lists are
+    returned unchanged.
+    """
+    values = record["values"]
+    if isinstance(values, list):
+        return record
+    tolist = getattr(values, "tolist", None)
+    return {**record, "values": tolist() if tolist is not None else list(values)}
+
+
 # =============================================================================
 # Pinecone Client
 # =============================================================================
@@ -65,6 +93,7 @@ class PineconeClient:
     Usage:
         client = PineconeClient()
         client.connect()
+        await client.ensure_index()
 
         # Upsert vectors
         await client.upsert_embeddings([
@@ -76,6 +105,11 @@ class PineconeClient:
 
         # Delete
         await client.delete(["vec1"])
+
+    Connection pooling: blocking SDK calls run on a PINECONE_POOL_SIZE-thread
+    executor, and the index's HTTP connection pool is sized to match so
+    concurrent requests each keep a warm keep-alive connection instead of
+    queueing for (or discarding) pooled sockets.
     """
 
     # Index configuration
@@ -96,7 +130,7 @@ class PineconeClient:
             api_key: Pinecone API key. Defaults to settings.pinecone_api_key.
             index_name: Index name. Defaults to settings.pinecone_index_name.
         """
-        self._api_key = api_key or settings.pinecone_api_key.get_secret_value()
+        self._api_key = api_key or _PINECONE_API_KEY
         self._index_name = index_name or settings.pinecone_index_name
         self._client: Pinecone | None = None
         self._index: Any = None
@@ -134,7 +168,7 @@ class PineconeClient:
             raise RuntimeError("Pinecone index not initialized. Call ensure_index() first.")
         return self._index
 
-    def ensure_index(self, wait_for_ready: bool = True) -> None:
+    async def ensure_index(self, wait_for_ready: bool = True) -> None:
         """
         Create the index if it doesn't exist and connect to it.
 
@@ -145,9 +179,7 @@ class PineconeClient:
             KnowledgeStoreConnectionError: If index creation or connection fails.
         """
         try:
-            existing_indexes = [idx.name for idx in self.client.list_indexes()]
-
-            if self._index_name not in existing_indexes:
+            if not await self._run_sync(self.client.has_index, name=self._index_name):
                 logger.info(
                     "pinecone_creating_index",
                     index_name=self._index_name,
@@ -155,7 +187,8 @@ class PineconeClient:
                     metric=self.METRIC,
                 )
 
-                self.client.create_index(
+                await self._run_sync(
+                    self.client.create_index,
                     name=self._index_name,
                     dimension=self.DIMENSION,
                     metric=self.METRIC,
@@ -166,14 +199,19 @@ class PineconeClient:
                 )
 
                 if wait_for_ready:
-                    self._wait_for_index_ready()
+                    await self._wait_for_index_ready()
 
                 logger.info("pinecone_index_created", index_name=self._index_name)
             else:
                 logger.info("pinecone_index_exists", index_name=self._index_name)
 
             # Connect to the index
-            self._index = self.client.Index(self._index_name)
+            self._index = await self._run_sync(
+                self.client.Index,
+                name=self._index_name,
+                pool_threads=settings.pinecone_pool_size,
+                connection_pool_maxsize=settings.pinecone_pool_size,
+            )
             logger.info("pinecone_index_connected", index_name=self._index_name)
 
         except TimeoutError as e:
@@ -194,41 +232,69 @@ class PineconeClient:
                 {"index_name": self._index_name, "original_error": str(e)},
             )
 
-    def _wait_for_index_ready(self, timeout: int = 300) -> None:
+    async def _wait_for_index_ready(self, timeout: int = 300) -> None:
         """
         Wait for index to be ready.
 
+        Polls with exponential backoff (0.5s doubling up to 10s), so a fast
+        index is picked up quickly and the event loop stays free meanwhile.
+
         Args:
             timeout: Maximum seconds to wait.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        delay = 0.5
         while True:
             try:
-                description = self.client.describe_index(self._index_name)
+                description = await self._run_sync(
+                    self.client.describe_index, name=self._index_name
+                )
                 if description.status.ready:
                     return
             except Exception:
                 pass
 
-            if time.time() - start_time > timeout:
+            if time.monotonic() > deadline:
                 raise TimeoutError(f"Index {self._index_name} not ready after {timeout}s")
 
-            time.sleep(5)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 10.0)
             logger.debug("pinecone_waiting_for_index", index_name=self._index_name)
 
+    async def _run_sync(self, func: Callable[..., T], /, **kwargs: Any) -> T:
+        """
+        Run a blocking Pinecone SDK call off the event loop.
+
+        The pinned SDK (pinecone 5.x) has no asyncio index client, so every
+        index operation goes through this one hop. Swap the body for native
+        awaits once the SDK is upgraded.
+
+        Args:
+            func: SDK method to call.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The SDK call's result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, functools.partial(func, **kwargs))
+
     async def upsert_embeddings(
         self,
         vectors: list[VectorRecord],
         namespace: str = "",
         batch_size: int = 100,
+        concurrency: int = 16,
     ) -> dict[str, int]:
         """
         Upsert vectors to the index.
 
         Args:
             vectors: List of vector records with id, values, and metadata.
+                Values may be lists or array-likes such as float32 ndarrays.
             namespace: Optional namespace for organization.
             batch_size: Number of vectors per batch.
+            concurrency: Maximum batches in flight at once.
 
         Returns:
             Upsert statistics.
@@ -245,36 +311,30 @@ class PineconeClient:
                 {"recovery_time": recovery_time},
             )
 
-        total_upserted = 0
+        semaphore = asyncio.Semaphore(concurrency)
 
-        try:
-            # Process in batches
-            for i in range(0, len(vectors), batch_size):
-                batch = vectors[i : i + batch_size]
-
-                # Convert to Pinecone format
-                pinecone_vectors = [
-                    {
-                        "id": v["id"],
-                        "values": v["values"],
-                        "metadata": v.get("metadata", {}),
-                    }
-                    for v in batch
-                ]
-
-                # Run upsert in thread pool (Pinecone client is sync)
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    lambda pv=pinecone_vectors: self.index.upsert(vectors=pv, namespace=namespace),
-                )
+        async def _upsert_batch(batch: list[VectorRecord]) -> int:
+            # VectorRecord already matches the SDK's dict format (metadata is
+            # optional there too), so send the slice as-is without copying
+            # unless some values arrived as arrays
+            if not all(isinstance(v["values"], list) for v in batch):
+                batch = [_to_wire_record(v) for v in batch]
+
+            async with semaphore:
+                result = await self._run_sync(self.index.upsert, vectors=batch, namespace=namespace)
 
-                total_upserted += result.upserted_count
-                logger.debug(
-                    "pinecone_batch_upserted",
-                    batch_size=len(batch),
-                    total=total_upserted,
+            logger.debug("pinecone_batch_upserted", batch_size=len(batch))
+            return result.upserted_count
+
+        try:
+            # Batches are independent, so keep several requests in flight
+            counts = await asyncio.gather(
+                *(
+                    _upsert_batch(vectors[i : i + batch_size])
+                    for i in range(0, len(vectors), batch_size)
                 )
+            )
+            total_upserted = sum(counts)
 
             await _pinecone_breaker.record_success()
             logger.info("pinecone_upsert_completed", total_upserted=total_upserted)
@@ -330,17 +390,14 @@ class PineconeClient:
             )
 
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self.index.query(
-                    vector=vector,
-                    top_k=top_k,
-                    filter=filter,
-                    namespace=namespace,
-                    include_metadata=include_metadata,
-                    include_values=include_values,
-                ),
+            result = await self._run_sync(
+                self.index.query,
+                vector=vector,
+                top_k=top_k,
+                filter=filter,
+                namespace=namespace,
+                include_metadata=include_metadata,
+                include_values=include_values,
             )
 
             matches = []
@@ -349,10 +406,14 @@ class PineconeClient:
                     "id": match.id,
                     "score": match.score,
                 }
-                if include_metadata and match.metadata:
-                    record["metadata"] = dict(match.metadata)
-                if include_values and match.values:
-                    record["values"] = list(match.values)
+                # The SDK already returns a fresh dict/list per response, so
+                # hand them over rather than copying
+                metadata = match.metadata
+                if include_metadata and metadata:
+                    record["metadata"] = metadata if isinstance(metadata, dict) else dict(metadata)
+                values = match.values
+                if include_values and values:
+                    record["values"] = values if isinstance(values, list) else list(values)
                 matches.append(record)
 
             await _pinecone_breaker.record_success()
@@ -388,30 +449,25 @@ class PineconeClient:
             namespace: Optional namespace.
             delete_all: Delete all vectors in namespace.
         """
-        loop = asyncio.get_event_loop()
-
+        kwargs: dict[str, Any] = {"namespace": namespace}
         if delete_all:
-            await loop.run_in_executor(
-                None,
-                lambda: self.index.delete(delete_all=True, namespace=namespace),
-            )
-            logger.info("pinecone_delete_all", namespace=namespace)
+            kwargs["delete_all"] = True
+            event, detail = "pinecone_delete_all", {"namespace": namespace}
         elif ids:
-            await loop.run_in_executor(
-                None,
-                lambda: self.index.delete(ids=ids, namespace=namespace),
-            )
-            logger.info("pinecone_delete_ids", count=len(ids))
+            kwargs["ids"] = ids
+            event, detail = "pinecone_delete_ids", {"count": len(ids)}
         elif filter:
-            await loop.run_in_executor(
-                None,
-                lambda: self.index.delete(filter=filter, namespace=namespace),
-            )
-            logger.info("pinecone_delete_filter", filter=filter)
+            kwargs["filter"] = filter
+            event, detail = "pinecone_delete_filter", {"filter": filter}
+        else:
+            return
+
+        await self._run_sync(self.index.delete, **kwargs)
+        logger.info(event, **detail)
 
-    def get_stats(self) -> dict[str, Any]:
+    async def get_stats(self) -> dict[str, Any]:
         """Get index statistics."""
-        stats = self.index.describe_index_stats()
+        stats = await self._run_sync(self.index.describe_index_stats)
         return {
             "total_vector_count": stats.total_vector_count,
             "dimension": stats.dimension,
@@ -447,11 +503,11 @@ async def test_connection() -> None:
 
     # Ensure index exists
     print(f"\nEnsuring index '{settings.pinecone_index_name}' exists...")
-    client.ensure_index(wait_for_ready=True)
+    await client.ensure_index(wait_for_ready=True)
     print(f"[OK] Index ready")
 
     # Get stats
-    stats = client.get_stats()
+    stats = await client.get_stats()
     print(f"[OK] Index stats: {stats['total_vector_count']} vectors, dimension={stats['dimension']}")
 
     # Create sample vector (1024 dimensions for Cohere embed-v3)
@@ -501,7 +557,7 @@ async def test_connection() -> None:
 
     # Final stats
     await asyncio.sleep(1)
-    stats = client.get_stats()
+    stats = await client.get_stats()
     print(f"\n[OK] Final stats: {stats['total_vector_count']} vectors")
 
     print("\n" + "=" * 60)
@@ -8,10 +8,12 @@ relevance scoring in the Adaptive RAG pipeline.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, TypedDict
+import weakref
+from typing import Any, ClassVar, TypedDict
 
-import structlog
 import cohere
+import httpx
+import structlog
 from cohere.core import ApiError
 from tenacity import (
     retry,
@@ -24,6 +26,25 @@ from src.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# Settings are loaded once per process, so unwrap the secret once too
+_COHERE_API_KEY = settings.cohere_api_key.get_secret_value()
+
+
+def _new_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Build the HTTP transport for a shared Cohere client.
+
+    A large keep-alive pool keeps connections warm through bursts (httpx
+    keeps only 20 idle by default), and HTTP/2 multiplexes concurrent
+    reranks over those connections. Transport-level retries are off since
+    rerank() retries API errors itself.
+    """
+    return httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        http2=True,
+        retries=0,
+    )
+
 
 class RerankResult(TypedDict):
     """Result from reranking a document."""
@@ -56,6 +77,21 @@ class RerankerService:
 
     MODEL = "rerank-v3.5"
 
+    # Cohere clients shared by every instance, per event loop and API key, so
+    # the HTTP connection pool (and its TLS sessions) outlives any one service.
+    # httpx pools are bound to the loop they were created on.
+    _client_cache: ClassVar[
+        weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, tuple[cohere.AsyncClientV2, httpx.AsyncClient]]
+        ]
+    ] = weakref.WeakKeyDictionary()
+
+    # In-flight rerank calls per event loop, keyed by request, so concurrent
+    # identical requests share one API call
+    _inflight: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[Any, ...], asyncio.Task]]
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(self, api_key: str | None = None) -> None:
         """
         Initialize the reranker service.
@@ -63,16 +99,76 @@ class RerankerService:
         Args:
             api_key: Cohere API key. Defaults to settings.cohere_api_key.
         """
-        self._api_key = api_key or settings.cohere_api_key.get_secret_value()
+        self._api_key = api_key or _COHERE_API_KEY
         self._client: cohere.AsyncClientV2 | None = None
 
     @property
     def client(self) -> cohere.AsyncClientV2:
-        """Get or create the Cohere async client."""
+        """Get the shared Cohere async client for this API key."""
         if self._client is None:
-            self._client = cohere.AsyncClientV2(api_key=self._api_key)
+            clients = self._client_cache.setdefault(asyncio.get_running_loop(), {})
+            cached = clients.get(self._api_key)
+            if cached is None:
+                http_client = httpx.AsyncClient(transport=_new_transport(), timeout=30.0)
+                cached = (
+                    cohere.AsyncClientV2(api_key=self._api_key, httpx_client=http_client),
+                    http_client,
+                )
+                clients[self._api_key] = cached
+            self._client = cached[0]
         return self._client
 
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """
+        Close the shared Cohere clients for the running event loop.
+
+        Call once at application shutdown.
+        """
+        clients = cls._client_cache.pop(asyncio.get_running_loop(), {})
+        for _, http_client in clients.values():
+            await http_client.aclose()
+        if clients:
+            logger.info("cohere_rerank_clients_closed", count=len(clients))
+
+    async def _coalesced_rerank(self, query: str, documents: list[str], top_n: int) -> Any:
+        """
+        Call the Cohere rerank API, sharing the call with identical requests.
+
+        Cohere's rerank endpoint takes one query per call, so concurrent
+        requests cannot be merged into a single batch; identical ones (same
+        query, documents and top_n - e.g. many users on one dashboard) are
+        coalesced instead, saving the round trip and the rate-limit token.
+
+        Args:
+            query: The search query.
+            documents: Non-empty document texts.
+            top_n: Number of results to request.
+
+        Returns:
+            The Cohere rerank response.
+        """
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        key = (self._api_key, query, tuple(documents), top_n)
+
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.client.rerank(
+                    model=self.MODEL,
+                    query=query,
+                    documents=documents,
+                    top_n=top_n,
+                )
+            )
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        else:
+            logger.debug("rerank_coalesced", doc_count=len(documents))
+
+        # Shield so one caller's cancellation doesn't cancel the shared call
+        return await asyncio.shield(task)
+
     @retry(
         retry=retry_if_exception_type((ApiError,)),
         wait=wait_exponential(multiplier=1, min=1, max=60),
@@ -88,6 +184,7 @@ class RerankerService:
         query: str,
         documents: list[str],
         top_k: int = 10,
+        assume_nonempty: bool = False,
     ) -> list[RerankResult]:
         """
         Rerank documents by relevance to query.
@@ -96,6 +193,8 @@ class RerankerService:
             query: The search query.
             documents: List of document texts to rerank.
             top_k: Number of top results to return.
+            assume_nonempty: Skip filtering empty documents. Only set when the
+                caller guarantees every document has text.
 
         Returns:
             List of reranked results sorted by relevance score (descending).
@@ -106,31 +205,32 @@ class RerankerService:
         if not documents:
             return []
 
-        # Filter empty documents and track original indices
-        valid_docs: list[tuple[int, str]] = [
-            (i, doc) for i, doc in enumerate(documents) if doc and doc.strip()
-        ]
+        # Original index of each document sent; None when sent unfiltered
+        original_indices: list[int] | None = None
 
-        if not valid_docs:
-            raise ValueError("All documents are empty")
+        if assume_nonempty:
+            doc_texts = documents
+        else:
+            # Filter empty documents and track original indices in one pass
+            # (isspace() checks without allocating a stripped copy)
+            doc_texts = []
+            original_indices = []
+            for i, doc in enumerate(documents):
+                if doc and not doc.isspace():
+                    doc_texts.append(doc)
+                    original_indices.append(i)
 
-        doc_texts = [doc for _, doc in valid_docs]
-        original_indices = [idx for idx, _ in valid_docs]
+            if not doc_texts:
+                raise ValueError("All documents are empty")
 
         # Call Cohere rerank API
-        response = await self.client.rerank(
-            model=self.MODEL,
-            query=query,
-            documents=doc_texts,
-            top_n=min(top_k, len(doc_texts)),
-        )
+        response = await self._coalesced_rerank(query, doc_texts, min(top_k, len(doc_texts)))
 
         # Build results with original indices
         results: list[RerankResult] = []
         for item in response.results:
-            original_idx = original_indices[item.index]
             result: RerankResult = {
-                "index": original_idx,
+                "index": item.index if original_indices is None else original_indices[item.index],
                 "score": item.relevance_score,
                 "text": doc_texts[item.index],
             }
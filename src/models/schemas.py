@@ -1,10 +1,12 @@
 """Pydantic models for LocalPulse core entities."""
 
+import types
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, ClassVar, Iterable, Optional, Union, get_args, get_origin
 from uuid import UUID, uuid4
 
+import orjson
 from pydantic import BaseModel, Field
 
 
@@ -23,6 +25,50 @@ class PriceRange(str, Enum):
     FINE_DINING = "$$$$"
 
 
+def _dump_json(value: Any) -> str:
+    """Serialize a nested structure to a JSON string for a Neo4j property."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Get X from Optional[X] / X | None; other annotations are returned as is."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _decode_uuid(value: Any) -> Any:
+    return UUID(value) if isinstance(value, str) else value
+
+
+def _decode_datetime(value: Any) -> Any:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _pick_neo4j_encoder(annotation: Any) -> Callable[[Any], Any] | None:
+    """Choose how a field's JSON-mode dumped value is stored as a Neo4j property."""
+    annotation = _unwrap_optional(annotation)
+    if annotation is dict or get_origin(annotation) is dict:
+        # Neo4j supports lists of primitives, but nested structures
+        # should be serialized as JSON strings
+        return _dump_json
+    return None
+
+
+def _pick_neo4j_decoder(annotation: Any) -> Callable[[Any], Any] | None:
+    """Choose how a Neo4j property is converted back for a field."""
+    annotation = _unwrap_optional(annotation)
+    if annotation is UUID:
+        return _decode_uuid
+    if annotation is datetime:
+        return _decode_datetime
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    return None
+
+
 # =============================================================================
 # Base Models
 # =============================================================================
@@ -34,68 +80,88 @@ class BaseEntity(BaseModel):
     class Config:
         from_attributes = True
         populate_by_name = True
+        # Entities are records: build a new one (model_copy(update=...))
+        # rather than mutating, so hydrated instances can be shared safely
+        frozen = True
+
+    # Per-class field converters for Neo4j, built once when the subclass is
+    # defined rather than re-deriving them from annotations on every row
+    _neo4j_encoders: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+    _neo4j_decoders: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+
+    # Fields stored on the node as JSON strings and parsed back on read
+    _JSON_FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._neo4j_encoders = {}
+        cls._neo4j_decoders = {}
+        for name, field_info in cls.model_fields.items():
+            if name in cls._JSON_FIELDS:
+                cls._neo4j_encoders[name] = _dump_json
+                cls._neo4j_decoders[name] = orjson.loads
+                continue
+            encoder = _pick_neo4j_encoder(field_info.annotation)
+            if encoder is not None:
+                cls._neo4j_encoders[name] = encoder
+            decoder = _pick_neo4j_decoder(field_info.annotation)
+            if decoder is not None:
+                cls._neo4j_decoders[name] = decoder
 
     def to_neo4j_properties(self) -> dict[str, Any]:
         """Convert model to Neo4j node properties.
 
-        Neo4j doesn't support UUID or datetime directly, so we convert them.
+        Neo4j doesn't support UUID or datetime directly; JSON-mode dumping
+        converts them (and enums) to primitives in pydantic-core.
         """
-        data = self.model_dump()
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, UUID):
-                result[key] = str(value)
-            elif isinstance(value, datetime):
-                result[key] = value.isoformat()
-            elif isinstance(value, Enum):
-                result[key] = value.value
-            elif isinstance(value, (list, dict)):
-                # Neo4j supports lists of primitives, but nested structures
-                # should be serialized as JSON strings
-                import json
-                result[key] = json.dumps(value) if isinstance(value, dict) else value
-            elif value is not None:
-                result[key] = value
+        result = self.model_dump(mode="json", exclude_none=True)
+        for key, encoder in self._neo4j_encoders.items():
+            if key in result:
+                result[key] = encoder(result[key])
         return result
 
     @classmethod
-    def from_neo4j_node(cls, node: dict[str, Any]) -> "BaseEntity":
-        """Create model instance from Neo4j node properties."""
-        import json
+    def to_neo4j_batch_properties(cls, items: Iterable["BaseEntity"]) -> list[dict[str, Any]]:
+        """Convert entities to property maps for a single UNWIND write.
+
+        Pass the result as one parameter list (e.g. to
+        Neo4jClient.upsert_businesses) instead of writing row by row.
+
+        Args:
+            items: Entities of this class.
 
+        Returns:
+            One property dict per entity, in order.
+        """
+        return [item.to_neo4j_properties() for item in items]
+
+    @classmethod
+    def from_neo4j_node(cls, node: dict[str, Any], trusted: bool = False) -> "BaseEntity":
+        """Create model instance from Neo4j node properties.
+
+        Args:
+            node: Node properties as returned by Neo4j.
+            trusted: Skip validation and build the model with model_construct.
+                Only for nodes written by to_neo4j_properties(), which were
+                validated when the model was created.
+
+        Returns:
+            The hydrated model.
+        """
         data = dict(node)
-        # Convert string UUIDs back to UUID objects
-        for field_name, field_info in cls.model_fields.items():
-            if field_name in data:
-                annotation = field_info.annotation
-                # Handle Optional types
-                origin = getattr(annotation, "__origin__", None)
-                if origin is type(None) or str(origin) == "typing.Union":
-                    args = getattr(annotation, "__args__", ())
-                    annotation = args[0] if args else annotation
-
-                if annotation is UUID or (hasattr(annotation, "__origin__") and annotation.__origin__ is UUID):
-                    if data[field_name] is not None:
-                        data[field_name] = UUID(data[field_name])
-                elif annotation is datetime:
-                    if data[field_name] is not None and isinstance(data[field_name], str):
-                        data[field_name] = datetime.fromisoformat(data[field_name])
+        # Convert UUID/datetime/enum strings and JSON fields back to Python objects
+        for field_name, decoder in cls._neo4j_decoders.items():
+            value = data.get(field_name)
+            if value is not None:
+                data[field_name] = decoder(value)
+        if trusted:
+            return cls.model_construct(**data)
         return cls.model_validate(data)
 
     def to_db_row(self) -> dict[str, Any]:
         """Convert model to database row format (e.g., for Supabase/PostgreSQL)."""
-        data = self.model_dump()
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, UUID):
-                result[key] = str(value)
-            elif isinstance(value, datetime):
-                result[key] = value.isoformat()
-            elif isinstance(value, Enum):
-                result[key] = value.value
-            else:
-                result[key] = value
-        return result
+        return self.model_dump(mode="json")
 
     @classmethod
     def from_db_row(cls, row: dict[str, Any]) -> "BaseEntity":
@@ -146,13 +212,6 @@ class Business(BaseEntity):
         default_factory=datetime.utcnow, description="Last update timestamp"
     )
 
-    def to_neo4j_properties(self) -> dict[str, Any]:
-        """Convert to Neo4j properties with price_range as string."""
-        props = super().to_neo4j_properties()
-        if self.price_range:
-            props["price_range"] = self.price_range.value
-        return props
-
 
 class Review(BaseEntity):
     """Customer review for a business."""
@@ -224,30 +283,12 @@ class AnalysisReport(BaseEntity):
         default_factory=datetime.utcnow, description="Record creation timestamp"
     )
 
-    def to_neo4j_properties(self) -> dict[str, Any]:
-        """Convert to Neo4j properties, serializing complex types as JSON."""
-        import json
-
-        props = super().to_neo4j_properties()
-        # Ensure complex types are JSON strings for Neo4j
-        props["sentiment_trend"] = json.dumps(self.sentiment_trend)
-        props["top_themes"] = json.dumps(self.top_themes)
-        props["competitor_comparison"] = json.dumps(self.competitor_comparison)
-        props["recommendations"] = json.dumps(self.recommendations)
-        return props
-
-    @classmethod
-    def from_neo4j_node(cls, node: dict[str, Any]) -> "AnalysisReport":
-        """Create from Neo4j node, deserializing JSON fields."""
-        import json
-
-        data = dict(node)
-        # Parse JSON strings back to Python objects
-        for field in ["sentiment_trend", "top_themes", "competitor_comparison", "recommendations"]:
-            if field in data and isinstance(data[field], str):
-                data[field] = json.loads(data[field])
-
-        return super().from_neo4j_node(data)
+    _JSON_FIELDS: ClassVar[tuple[str, ...]] = (
+        "sentiment_trend",
+        "top_themes",
+        "competitor_comparison",
+        "recommendations",
+    )
 
 
 # =============================================================================
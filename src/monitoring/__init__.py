@@ -26,6 +26,7 @@ from src.monitoring.error_metrics import (
     get_error_metrics_store,
     reset_error_metrics_store,
 )
+from src.monitoring.logging_config import configure_logging
 from src.monitoring.metrics import (
     AGENT_EXECUTION_DURATION,
     API_REQUEST_DURATION,
@@ -70,4 +71,6 @@ __all__ = [
     "ErrorRecord",
     "get_error_metrics_store",
     "reset_error_metrics_store",
+    # Logging
+    "configure_logging",
 ]
@@ -20,20 +20,47 @@ Usage:
     trend = await store.get_error_trend("ValidationError", bucket_minutes=5, buckets=12)
 """
 
-import json
 import logging
 import os
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Set of every error type recorded, so readers needn't SCAN for them
+_ERROR_TYPES_KEY = "errors:types"
+
+# Stores one error occurrence and trims expired entries in a single
+# server-side call.
+# KEYS: errors:{type}, errors:by_endpoint:{endpoint}, errors:counts:{type}, errors:types
+# ARGV: member, timestamp, retention cutoff, error type
+_RECORD_ERROR_SCRIPT = """
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+redis.call('ZADD', KEYS[2], ARGV[2], ARGV[1])
+redis.call('INCR', KEYS[3])
+redis.call('SADD', KEYS[4], ARGV[4])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], 0, ARGV[3])
+return 1
+"""
+
+
+_ENDPOINT_KEY_TABLE = str.maketrans("/", "_")
+
 
-@dataclass
+@lru_cache(maxsize=512)
+def _endpoint_key(endpoint: str) -> str:
+    """Return the URL-safe key suffix for an endpoint (e.g. /api/x -> api_x)."""
+    return endpoint.translate(_ENDPOINT_KEY_TABLE).strip("_")
+
+
+@dataclass(slots=True)
 class ErrorRecord:
     """Single error occurrence record."""
 
@@ -54,6 +81,7 @@ class ErrorMetricsStore:
     - errors:{error_type} -> sorted set (score=timestamp, member=json(record))
     - errors:by_endpoint:{endpoint} -> sorted set
     - errors:counts:{error_type} -> string (counter)
+    - errors:types -> set of every recorded error type
 
     Args:
         redis_url: Redis connection URL (default: from REDIS_URL env var)
@@ -69,13 +97,21 @@ class ErrorMetricsStore:
         self.retention_hours = retention_hours
         self.retention_seconds = retention_hours * 3600
         self._redis: Any = None
+        self._record_script: Any = None
         self._use_redis = bool(self.redis_url)
-        self._memory_store: dict[str, list[ErrorRecord]] = defaultdict(list)
+        # Records are appended in timestamp order, so expiry pops from the left
+        self._memory_store: dict[str, deque[ErrorRecord]] = defaultdict(deque)
+        # The same records indexed by endpoint, for endpoint queries
+        self._memory_by_endpoint: dict[str, deque[ErrorRecord]] = defaultdict(deque)
         self._memory_counts: dict[str, int] = defaultdict(int)
         self._connected = False
 
     async def _get_redis(self) -> Any:
-        """Get or create Redis connection."""
+        """Get or create Redis connection.
+
+        Once connected, callers read self._redis directly while
+        self._connected is set, skipping this coroutine on the hot path.
+        """
         if not self._use_redis:
             return None
 
@@ -142,34 +178,29 @@ class ErrorMetricsStore:
             context=context or {},
         )
 
-        redis = await self._get_redis()
+        redis = self._redis if self._connected else await self._get_redis()
         if redis:
-            member = json.dumps({
-                "error_type": error_type,
-                "endpoint": endpoint,
-                "timestamp": timestamp,
-                "message": message,
-                "context": context or {},
-            })
+            # orjson serializes the dataclass natively (no intermediate dict)
+            # and emits bytes, which redis-py sends as-is without re-encoding
+            member = orjson.dumps(record)
 
-            pipe = redis.pipeline()
-
-            # Store by error type
-            pipe.zadd(f"errors:{error_type}", {member: timestamp})
-
-            # Store by endpoint (URL-safe key)
-            safe_endpoint = endpoint.replace("/", "_").strip("_")
-            pipe.zadd(f"errors:by_endpoint:{safe_endpoint}", {member: timestamp})
-
-            # Increment counter
-            pipe.incr(f"errors:counts:{error_type}")
-
-            # Clean up old entries
+            safe_endpoint = _endpoint_key(endpoint)
             cutoff = timestamp - self.retention_seconds
-            pipe.zremrangebyscore(f"errors:{error_type}", 0, cutoff)
-            pipe.zremrangebyscore(f"errors:by_endpoint:{safe_endpoint}", 0, cutoff)
 
-            await pipe.execute()
+            # Registered once; redis-py runs it via EVALSHA and reloads the
+            # script itself if the server has flushed its script cache
+            if self._record_script is None:
+                self._record_script = redis.register_script(_RECORD_ERROR_SCRIPT)
+
+            await self._record_script(
+                keys=[
+                    f"errors:{error_type}",
+                    f"errors:by_endpoint:{safe_endpoint}",
+                    f"errors:counts:{error_type}",
+                    _ERROR_TYPES_KEY,
+                ],
+                args=[member, timestamp, cutoff, error_type],
+            )
 
             logger.debug(
                 "error_recorded",
@@ -179,14 +210,19 @@ class ErrorMetricsStore:
             )
         else:
             # In-memory fallback
-            self._memory_store[error_type].append(record)
+            records = self._memory_store[error_type]
+            records.append(record)
             self._memory_counts[error_type] += 1
 
+            by_endpoint = self._memory_by_endpoint[endpoint]
+            by_endpoint.append(record)
+
             # Clean up old entries
             cutoff = timestamp - self.retention_seconds
-            self._memory_store[error_type] = [
-                r for r in self._memory_store[error_type] if r.timestamp > cutoff
-            ]
+            while records and records[0].timestamp <= cutoff:
+                records.popleft()
+            while by_endpoint and by_endpoint[0].timestamp <= cutoff:
+                by_endpoint.popleft()
 
             logger.debug(
                 "error_recorded",
@@ -209,7 +245,7 @@ class ErrorMetricsStore:
         Returns:
             Number of errors in the window
         """
-        redis = await self._get_redis()
+        redis = self._redis if self._connected else await self._get_redis()
         cutoff = time.time() - (window_minutes * 60)
 
         if redis:
@@ -217,7 +253,7 @@ class ErrorMetricsStore:
         else:
             return sum(
                 1
-                for r in self._memory_store.get(error_type, [])
+                for r in self._memory_store.get(error_type, ())
                 if r.timestamp > cutoff
             )
 
@@ -230,7 +266,7 @@ class ErrorMetricsStore:
         Returns:
             Total error count since store started or within retention
         """
-        redis = await self._get_redis()
+        redis = self._redis if self._connected else await self._get_redis()
         if redis:
             count = await redis.get(f"errors:counts:{error_type}")
             return int(count) if count else 0
@@ -251,29 +287,23 @@ class ErrorMetricsStore:
         Returns:
             List of (error_type, count) tuples sorted by count descending
         """
-        redis = await self._get_redis()
+        redis = self._redis if self._connected else await self._get_redis()
 
         if redis:
-            # Scan for error keys and count
-            error_counts: list[tuple[str, int]] = []
-            cursor = 0
-            seen_types: set[str] = set()
-
-            while True:
-                cursor, keys = await redis.scan(
-                    cursor, match="errors:counts:*", count=100
-                )
-                for key in keys:
-                    error_type = key.replace("errors:counts:", "")
-                    if error_type not in seen_types:
-                        seen_types.add(error_type)
-                        count = await self.get_error_count(error_type, window_minutes)
-                        if count > 0:
-                            error_counts.append((error_type, count))
-
-                if cursor == 0:
-                    break
-
+            # Read the type registry rather than scanning the whole keyspace,
+            # then count every type in one round trip
+            error_types = list(await redis.smembers(_ERROR_TYPES_KEY))
+            cutoff = time.time() - (window_minutes * 60)
+            pipe = redis.pipeline()
+            for error_type in error_types:
+                pipe.zcount(f"errors:{error_type}", cutoff, "+inf")
+            counts = await pipe.execute()
+
+            error_counts = [
+                (error_type, count)
+                for error_type, count in zip(error_types, counts)
+                if count > 0
+            ]
             return sorted(error_counts, key=lambda x: x[1], reverse=True)[:limit]
         else:
             cutoff = time.time() - (window_minutes * 60)
@@ -304,28 +334,28 @@ class ErrorMetricsStore:
         """
         now = time.time()
         bucket_seconds = bucket_minutes * 60
-        results: list[tuple[float, int]] = []
-
-        redis = await self._get_redis()
+        bounds = [
+            (now - (i + 1) * bucket_seconds, now - i * bucket_seconds)
+            for i in range(buckets - 1, -1, -1)
+        ]
 
-        for i in range(buckets - 1, -1, -1):
-            bucket_end = now - (i * bucket_seconds)
-            bucket_start = bucket_end - bucket_seconds
+        redis = self._redis if self._connected else await self._get_redis()
 
-            if redis:
-                count = await redis.zcount(
-                    f"errors:{error_type}", bucket_start, bucket_end
-                )
-            else:
-                count = sum(
-                    1
-                    for r in self._memory_store.get(error_type, [])
-                    if bucket_start <= r.timestamp < bucket_end
-                )
-
-            results.append((bucket_start, count))
+        if redis:
+            # One round trip for every bucket rather than one per bucket
+            key = f"errors:{error_type}"
+            pipe = redis.pipeline()
+            for bucket_start, bucket_end in bounds:
+                pipe.zcount(key, bucket_start, bucket_end)
+            counts = await pipe.execute()
+        else:
+            records = self._memory_store.get(error_type, ())
+            counts = [
+                sum(1 for r in records if bucket_start <= r.timestamp < bucket_end)
+                for bucket_start, bucket_end in bounds
+            ]
 
-        return results
+        return [(bucket_start, count) for (bucket_start, _), count in zip(bounds, counts)]
 
     async def get_errors_by_endpoint(
         self,
@@ -344,37 +374,36 @@ class ErrorMetricsStore:
             List of error records as dictionaries
         """
         cutoff = time.time() - (window_minutes * 60)
-        safe_endpoint = endpoint.replace("/", "_").strip("_")
+        safe_endpoint = _endpoint_key(endpoint)
 
-        redis = await self._get_redis()
+        redis = self._redis if self._connected else await self._get_redis()
         if redis:
             key = f"errors:by_endpoint:{safe_endpoint}"
             raw_errors = await redis.zrangebyscore(
                 key, cutoff, "+inf", start=0, num=limit
             )
-            return [json.loads(e) for e in raw_errors]
+            return [orjson.loads(e) for e in raw_errors]
         else:
-            # In-memory: filter by endpoint across all types
+            # In-memory: walk this endpoint's records newest first
             errors = []
-            for records in self._memory_store.values():
-                for r in records:
-                    if r.endpoint == endpoint and r.timestamp > cutoff:
-                        errors.append({
-                            "error_type": r.error_type,
-                            "endpoint": r.endpoint,
-                            "timestamp": r.timestamp,
-                            "message": r.message,
-                            "context": r.context,
-                        })
-
-            errors.sort(key=lambda x: x["timestamp"], reverse=True)
-            return errors[:limit]
+            for r in reversed(self._memory_by_endpoint.get(endpoint, ())):
+                if r.timestamp <= cutoff or len(errors) >= limit:
+                    break
+                errors.append({
+                    "error_type": r.error_type,
+                    "endpoint": r.endpoint,
+                    "timestamp": r.timestamp,
+                    "message": r.message,
+                    "context": r.context,
+                })
+            return errors
 
     async def close(self) -> None:
         """Close Redis connection if open."""
         if self._redis:
             await self._redis.close()
             self._redis = None
+            self._record_script = None
             self._connected = False
             logger.info("error_metrics_store_disconnected")
 
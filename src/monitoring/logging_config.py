@@ -0,0 +1,41 @@
+"""
+structlog configuration for LocalPulse.
+
+structlog's default logger formats and prints every call regardless of level.
+configure_logging() swaps in a level-filtering bound logger so calls below
+the configured LOG_LEVEL return immediately, before any event dict is built.
+
+Usage:
+    from src.monitoring.logging_config import configure_logging
+
+    configure_logging()  # Uses settings.log_level
+"""
+
+import logging
+from typing import Optional
+
+import structlog
+
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """
+    Configure structlog to drop log calls below ``level``.
+
+    Module-level loggers from structlog.get_logger() are lazy proxies, so
+    they pick this configuration up even if created before it runs.
+
+    Args:
+        level: Level name such as "INFO". Defaults to settings.log_level.
+    """
+    if level is None:
+        # Imported here so src.monitoring stays importable without settings
+        from src.config.settings import get_settings
+
+        level = get_settings().log_level
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(level.upper())
+        ),
+        cache_logger_on_first_use=True,
+    )
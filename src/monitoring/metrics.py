@@ -18,9 +18,12 @@ Usage:
 """
 
 import logging
+import os
 import time
-from contextlib import contextmanager
-from typing import Any, Generator, Optional
+from contextlib import nullcontext
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, ContextManager, Optional
 
 import structlog
 
@@ -127,13 +130,158 @@ RATE_LIMIT_HITS = Counter(
 logger = structlog.get_logger(__name__)
 
 
+# =============================================================================
+# Label-bound Children
+# =============================================================================
+
+# .labels() hashes and validates the label values under the metric's lock on
+# every call. The children are long-lived, so resolve each label set once.
+
+
+@lru_cache(maxsize=1024)
+def _error_counter(error_type: str, endpoint: str) -> Counter:
+    return ERROR_COUNT.labels(error_type=error_type, endpoint=endpoint)
+
+
+@lru_cache(maxsize=256)
+def _rate_limit_counter(api_name: str) -> Counter:
+    return RATE_LIMIT_HITS.labels(api_name=api_name)
+
+
+# Gauge values for CIRCUIT_BREAKER_STATE
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+@lru_cache(maxsize=256)
+def _circuit_state_gauge(service: str) -> Gauge:
+    return CIRCUIT_BREAKER_STATE.labels(service=service)
+
+
+@lru_cache(maxsize=256)
+def _circuit_failure_counter(service: str) -> Counter:
+    return CIRCUIT_BREAKER_FAILURES.labels(service=service)
+
+
+@lru_cache(maxsize=512)
+def _agent_children(agent: str) -> tuple[Histogram, Counter, Counter]:
+    """Duration histogram plus success/error counters for an agent."""
+    return (
+        AGENT_EXECUTION_DURATION.labels(agent=agent),
+        AGENT_EXECUTION_TOTAL.labels(agent=agent, status="success"),
+        AGENT_EXECUTION_TOTAL.labels(agent=agent, status="error"),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _api_request_children(
+    method: str, endpoint: str, status_code: str
+) -> tuple[Histogram, Counter]:
+    """Duration histogram and request counter for one method/endpoint/status."""
+    return (
+        API_REQUEST_DURATION.labels(method=method, endpoint=endpoint, status_code=status_code),
+        API_REQUEST_TOTAL.labels(method=method, endpoint=endpoint, status_code=status_code),
+    )
+
+
+@lru_cache(maxsize=512)
+def _knowledge_store_children(store: str, operation: str) -> tuple[Histogram, Counter, Counter]:
+    """Latency histogram plus success/error counters for a store operation."""
+    return (
+        KNOWLEDGE_STORE_LATENCY.labels(store=store, operation=operation),
+        KNOWLEDGE_STORE_OPERATIONS.labels(store=store, operation=operation, status="success"),
+        KNOWLEDGE_STORE_OPERATIONS.labels(store=store, operation=operation, status="error"),
+    )
+
+
+@lru_cache(maxsize=512)
+def _collector_children(collector: str, operation: str) -> tuple[Histogram, Counter, Counter]:
+    """Latency histogram plus success/error counters for a collector operation."""
+    return (
+        COLLECTOR_LATENCY.labels(collector=collector, operation=operation),
+        COLLECTOR_OPERATIONS.labels(collector=collector, operation=operation, status="success"),
+        COLLECTOR_OPERATIONS.labels(collector=collector, operation=operation, status="error"),
+    )
+
+
 # =============================================================================
 # Tracking Context Managers
 # =============================================================================
 
 
-@contextmanager
-def track_agent_execution(agent_name: str) -> Generator[None, None, None]:
+class _OperationTracker:
+    """
+    Times a block and counts it as a success or error.
+
+    A plain class rather than a @contextmanager generator, so entering and
+    exiting is two method calls with no generator frame per operation.
+    """
+
+    __slots__ = ("_latency", "_success_count", "_error_count", "_start_ns")
+
+    def __init__(self, latency: Histogram, success_count: Counter, error_count: Counter) -> None:
+        self._latency = latency
+        self._success_count = success_count
+        self._error_count = error_count
+        self._start_ns = 0
+
+    def __enter__(self) -> None:
+        self._start_ns = time.perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> bool:
+        duration = (time.perf_counter_ns() - self._start_ns) * 1e-9
+        self._latency.observe(duration)
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self._error_count.inc()
+        else:
+            self._success_count.inc()
+        return False
+
+
+# Label strings for every HTTP status code, so the common int case skips str()
+_STATUS_STR = tuple(str(code) for code in range(600))
+
+
+class _ApiRequestTracker:
+    """Times an API request and counts it under the status code the caller sets."""
+
+    __slots__ = ("_method", "_endpoint", "_context", "_start_ns")
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        self._method = method
+        self._endpoint = endpoint
+        self._context = {"status_code": 500}  # Default to error
+        self._start_ns = 0
+
+    def __enter__(self) -> dict:
+        self._start_ns = time.perf_counter_ns()
+        return self._context
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> bool:
+        duration = (time.perf_counter_ns() - self._start_ns) * 1e-9
+        status = self._context.get("status_code", 500)
+        if type(status) is int and 0 <= status < len(_STATUS_STR):
+            status_code = _STATUS_STR[status]
+        else:
+            status_code = str(status)
+        duration_metric, request_count = _api_request_children(
+            self._method, self._endpoint, status_code
+        )
+        duration_metric.observe(duration)
+        request_count.inc()
+        return False
+
+
+def track_agent_execution(agent_name: str) -> ContextManager[None]:
     """
     Context manager to track agent execution duration and status.
 
@@ -141,24 +289,13 @@ def track_agent_execution(agent_name: str) -> Generator[None, None, None]:
         with track_agent_execution("research"):
             await agent.execute(query)
     """
-    start_time = time.perf_counter()
-    status = "success"
-    try:
-        yield
-    except Exception:
-        status = "error"
-        raise
-    finally:
-        duration = time.perf_counter() - start_time
-        AGENT_EXECUTION_DURATION.labels(agent=agent_name).observe(duration)
-        AGENT_EXECUTION_TOTAL.labels(agent=agent_name, status=status).inc()
-
-
-@contextmanager
+    return _OperationTracker(*_agent_children(agent_name))
+
+
 def track_api_request(
     method: str,
     endpoint: str,
-) -> Generator[dict, None, None]:
+) -> ContextManager[dict]:
     """
     Context manager to track API request duration and status.
 
@@ -167,30 +304,13 @@ def track_api_request(
             response = await call_endpoint()
             ctx["status_code"] = response.status_code
     """
-    start_time = time.perf_counter()
-    context = {"status_code": "500"}  # Default to error
-    try:
-        yield context
-    finally:
-        duration = time.perf_counter() - start_time
-        status_code = str(context.get("status_code", "500"))
-        API_REQUEST_DURATION.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=status_code,
-        ).observe(duration)
-        API_REQUEST_TOTAL.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=status_code,
-        ).inc()
-
-
-@contextmanager
+    return _ApiRequestTracker(method, endpoint)
+
+
 def track_knowledge_store_operation(
     store: str,
     operation: str,
-) -> Generator[None, None, None]:
+) -> ContextManager[None]:
     """
     Context manager to track knowledge store operations.
 
@@ -198,31 +318,13 @@ def track_knowledge_store_operation(
         with track_knowledge_store_operation("neo4j", "query"):
             result = await neo4j.run_query(...)
     """
-    start_time = time.perf_counter()
-    status = "success"
-    try:
-        yield
-    except Exception:
-        status = "error"
-        raise
-    finally:
-        duration = time.perf_counter() - start_time
-        KNOWLEDGE_STORE_OPERATIONS.labels(
-            store=store,
-            operation=operation,
-            status=status,
-        ).inc()
-        KNOWLEDGE_STORE_LATENCY.labels(
-            store=store,
-            operation=operation,
-        ).observe(duration)
-
-
-@contextmanager
+    return _OperationTracker(*_knowledge_store_children(store, operation))
+
+
 def track_collector_operation(
     collector: str,
     operation: str,
-) -> Generator[None, None, None]:
+) -> ContextManager[None]:
     """
     Context manager to track collector operations.
 
@@ -230,24 +332,36 @@ def track_collector_operation(
         with track_collector_operation("instagram", "scrape_posts"):
             posts = await collector.collect_user_posts(username)
     """
-    start_time = time.perf_counter()
-    status = "success"
-    try:
-        yield
-    except Exception:
-        status = "error"
-        raise
-    finally:
-        duration = time.perf_counter() - start_time
-        COLLECTOR_OPERATIONS.labels(
-            collector=collector,
-            operation=operation,
-            status=status,
-        ).inc()
-        COLLECTOR_LATENCY.labels(
-            collector=collector,
-            operation=operation,
-        ).observe(duration)
+    return _OperationTracker(*_collector_children(collector, operation))
+
+
+# =============================================================================
+# Disabled Instrumentation
+# =============================================================================
+
+
+def _metrics_disabled() -> bool:
+    """Check the METRICS_DISABLED environment variable."""
+    return os.getenv("METRICS_DISABLED", "").strip().lower() in ("1", "true", "yes")
+
+
+# Shared by every disabled tracker. The dict absorbs track_api_request
+# callers setting ctx["status_code"]; nothing ever reads it back.
+_NULL_TRACKER = nullcontext({})
+
+
+def _noop_tracker(*args: Any, **kwargs: Any) -> ContextManager[Any]:
+    """Stand-in for the track_* functions when metrics are disabled."""
+    return _NULL_TRACKER
+
+
+if _metrics_disabled():
+    # Rebind at import so existing `with track_...()` call sites skip the
+    # timers and label lookups entirely.
+    track_agent_execution = _noop_tracker  # type: ignore[assignment]
+    track_api_request = _noop_tracker  # type: ignore[assignment]
+    track_knowledge_store_operation = _noop_tracker  # type: ignore[assignment]
+    track_collector_operation = _noop_tracker  # type: ignore[assignment]
 
 
 def update_circuit_breaker_state(service: str, state: str) -> None:
@@ -258,13 +372,12 @@ def update_circuit_breaker_state(service: str, state: str) -> None:
         service: Service name
         state: Circuit state ("closed", "half_open", "open")
     """
-    state_map = {"closed": 0, "half_open": 1, "open": 2}
-    CIRCUIT_BREAKER_STATE.labels(service=service).set(state_map.get(state, 0))
+    _circuit_state_gauge(service).set(_CIRCUIT_STATE_VALUES.get(state, 0))
 
 
 def record_circuit_breaker_failure(service: str) -> None:
     """Record a circuit breaker failure."""
-    CIRCUIT_BREAKER_FAILURES.labels(service=service).inc()
+    _circuit_failure_counter(service).inc()
 
 
 async def record_error(
@@ -295,7 +408,7 @@ async def record_error(
         )
     """
     # Increment Prometheus counter
-    ERROR_COUNT.labels(error_type=error_type, endpoint=endpoint).inc()
+    _error_counter(error_type, endpoint).inc()
 
     # Persist to Redis for pattern analysis
     if persist:
@@ -324,7 +437,7 @@ def record_rate_limit_hit(api_name: str) -> None:
     Args:
         api_name: Name of the rate-limited API (e.g., "google_places", "instagram")
     """
-    RATE_LIMIT_HITS.labels(api_name=api_name).inc()
+    _rate_limit_counter(api_name).inc()
 
 
 # =============================================================================
@@ -332,10 +445,29 @@ def record_rate_limit_hit(api_name: str) -> None:
 # =============================================================================
 
 
+# Scrape bodies are reused for this long, so concurrent or back-to-back
+# scrapes don't each re-serialize every series. Kept well under the usual
+# 15s scrape interval.
+METRICS_CACHE_TTL_SECONDS = 2.0
+
+_metrics_cache: tuple[float, bytes] = (float("-inf"), b"")
+
+
+def _render_metrics() -> bytes:
+    """Return the exposition body, regenerating it at most once per TTL."""
+    global _metrics_cache
+    now = time.monotonic()
+    rendered_at, body = _metrics_cache
+    if now - rendered_at >= METRICS_CACHE_TTL_SECONDS:
+        body = generate_latest()
+        _metrics_cache = (now, body)
+    return body
+
+
 async def metrics_endpoint(request) -> Response:
     """Prometheus metrics endpoint handler."""
     return Response(
-        content=generate_latest(),
+        content=_render_metrics(),
         media_type=CONTENT_TYPE_LATEST,
     )
 
@@ -1,5 +1,5 @@
 """Orchestration module for multi-agent coordination."""
 
-from src.orchestration.discovery import AgentRegistry
+from src.orchestration.discovery import AgentRegistry, get_registry
 
-__all__ = ["AgentRegistry"]
+__all__ = ["AgentRegistry", "get_registry"]
@@ -3,14 +3,27 @@
 Provides singleton registry for agent registration, discovery, and routing.
 """
 
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, KeysView, List, Optional, TYPE_CHECKING, ValuesView
 
 if TYPE_CHECKING:
     from src.agents.base import BaseAgent
 
 
 class AgentCard:
-    """Metadata card describing an agent's capabilities."""
+    """Metadata card describing an agent's capabilities.
+
+    Cards are treated as immutable once registered.
+    """
+
+    __slots__ = (
+        "agent_id",
+        "name",
+        "description",
+        "capabilities",
+        "input_schema",
+        "output_schema",
+        "_dict_cache",
+    )
 
     def __init__(
         self,
@@ -27,17 +40,23 @@ class AgentCard:
         self.capabilities = capabilities
         self.input_schema = input_schema or {}
         self.output_schema = output_schema or {}
+        self._dict_cache: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        return {
-            "agent_id": self.agent_id,
-            "name": self.name,
-            "description": self.description,
-            "capabilities": self.capabilities,
-            "input_schema": self.input_schema,
-            "output_schema": self.output_schema,
-        }
+        """Convert to dictionary representation.
+
+        Built on first call and reused afterwards; treat it as read-only.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "agent_id": self.agent_id,
+                "name": self.name,
+                "description": self.description,
+                "capabilities": self.capabilities,
+                "input_schema": self.input_schema,
+                "output_schema": self.output_schema,
+            }
+        return self._dict_cache
 
 
 class AgentRegistry:
@@ -48,14 +67,18 @@ class AgentRegistry:
     """
 
     _instance: Optional["AgentRegistry"] = None
-    _cards: Dict[str, AgentCard] = {}
-    _agents: Dict[str, "BaseAgent"] = {}
+    # Populated by __new__ when the singleton is created
+    _cards: Dict[str, AgentCard]
+    _agents: Dict[str, "BaseAgent"]
+    # capability -> agent IDs offering it (dict keys keep registration order)
+    _capability_index: Dict[str, Dict[str, None]]
 
     def __new__(cls) -> "AgentRegistry":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._cards = {}
             cls._agents = {}
+            cls._capability_index = {}
         return cls._instance
 
     @classmethod
@@ -63,11 +86,52 @@ class AgentRegistry:
         """Reset the registry state. Primarily for testing."""
         cls._cards = {}
         cls._agents = {}
+        cls._capability_index = {}
         cls._instance = None
 
     def register_card(self, card: AgentCard) -> None:
         """Register an agent card for discovery."""
+        previous = self._cards.get(card.agent_id)
+        old_capabilities = set(previous.capabilities) if previous is not None else set()
+        for capability in old_capabilities.difference(card.capabilities):
+            self._unindex(capability, card.agent_id)
+
         self._cards[card.agent_id] = card
+        for capability in card.capabilities:
+            agent_ids = self._capability_index.setdefault(capability, {})
+            if previous is None or capability in old_capabilities:
+                agent_ids[card.agent_id] = None
+            elif card.agent_id not in agent_ids:
+                # A re-registered agent keeps its place in _cards, so slot the
+                # new capability in by that order rather than appending it
+                self._capability_index[capability] = {
+                    agent_id: None
+                    for agent_id in self._cards
+                    if agent_id in agent_ids or agent_id == card.agent_id
+                }
+
+    def unregister_card(self, agent_id: str) -> bool:
+        """Remove an agent's card and instance.
+
+        Returns:
+            True if a card was registered under agent_id.
+        """
+        self._agents.pop(agent_id, None)
+        card = self._cards.pop(agent_id, None)
+        if card is None:
+            return False
+        for capability in card.capabilities:
+            self._unindex(capability, agent_id)
+        return True
+
+    def _unindex(self, capability: str, agent_id: str) -> None:
+        """Drop agent_id from a capability, forgetting the capability once empty."""
+        agent_ids = self._capability_index.get(capability)
+        if agent_ids is None:
+            return
+        agent_ids.pop(agent_id, None)
+        if not agent_ids:
+            del self._capability_index[capability]
 
     def register_agent(self, agent_id: str, agent: "BaseAgent") -> None:
         """Register an agent instance."""
@@ -85,13 +149,42 @@ class AgentRegistry:
         """List all registered agent IDs."""
         return list(self._cards.keys())
 
+    def list_agents_iter(self) -> KeysView[str]:
+        """Live view of registered agent IDs, for read-only iteration.
+
+        Unlike list_agents(), no list is built. Do not register cards while
+        iterating over the view.
+        """
+        return self._cards.keys()
+
     def find_by_capability(self, capability: str) -> List[AgentCard]:
         """Find agents with a specific capability."""
         return [
-            card for card in self._cards.values()
-            if capability in card.capabilities
+            self._cards[agent_id]
+            for agent_id in self._capability_index.get(capability, ())
         ]
 
     def get_all_cards(self) -> List[AgentCard]:
         """Get all registered agent cards."""
         return list(self._cards.values())
+
+    def get_all_cards_view(self) -> ValuesView[AgentCard]:
+        """Live view of registered agent cards, for read-only iteration.
+
+        Unlike get_all_cards(), no list is built. Do not register cards while
+        iterating over the view.
+        """
+        return self._cards.values()
+
+
+def get_registry() -> AgentRegistry:
+    """Get the AgentRegistry singleton.
+
+    Reads the existing instance directly, skipping the constructor call
+    that AgentRegistry() goes through. Follows reset_registry().
+
+    Returns:
+        AgentRegistry instance (singleton)
+    """
+    registry = AgentRegistry._instance
+    return registry if registry is not None else AgentRegistry()
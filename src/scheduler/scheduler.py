@@ -24,19 +24,27 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone, timedelta
-from typing import Any, Literal, Optional
+from functools import cached_property
+from typing import Any, Callable, Literal, Optional, TypeVar
 from uuid import UUID, uuid4
 
+import httpx
 import structlog
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from supabase import create_client, Client
+from postgrest.exceptions import APIError
+from supabase import create_client, Client, ClientOptions
 
 from src.config.settings import get_settings
 from src.graphs.master_graph import run_full_pipeline
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# PostgreSQL SQLSTATE for unique_violation, surfaced as APIError.code
+_UNIQUE_VIOLATION = "23505"
+
 # Day name to cron day mapping
 DAY_TO_CRON = {
     "monday": 0,
@@ -167,7 +175,9 @@ async def initialize_supabase_table(supabase_client: Client) -> bool:
     """
     try:
         # Try to query the table to verify it exists
-        result = supabase_client.table("scheduled_jobs").select("id").limit(1).execute()
+        await asyncio.to_thread(
+            supabase_client.table("scheduled_jobs").select("id").limit(1).execute
+        )
         logger.info("supabase_table_check", status="accessible")
         return True
     except Exception as e:
@@ -184,6 +194,16 @@ async def initialize_supabase_table(supabase_client: Client) -> bool:
 # =============================================================================
 
 
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp column, passing None/empty through."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _at_hour(day: datetime, hour: int) -> datetime:
+    """Return ``hour``:00 UTC on the same calendar day as ``day``."""
+    return datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc)
+
+
 class ScheduledJob:
     """Represents a scheduled job for a client."""
 
@@ -215,6 +235,19 @@ class ScheduledJob:
         self.next_run = next_run
         self.created_at = created_at or datetime.now(timezone.utc)
 
+    @property
+    def schedule_day(self) -> Optional[DayType]:
+        """Day of week for weekly schedules."""
+        return self._schedule_day
+
+    @schedule_day.setter
+    def schedule_day(self, value: Optional[DayType]) -> None:
+        # Resolve the weekday index on assignment rather than on every
+        # schedule evaluation; the clients route reassigns this on updates.
+        self._schedule_day = value
+        self._schedule_day_idx = DAY_TO_CRON.get(value, 0) if value else None
+        self.__dict__.pop("cron_trigger", None)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for Supabase storage."""
         return {
@@ -235,8 +268,9 @@ class ScheduledJob:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ScheduledJob":
         """Create ScheduledJob from Supabase response."""
+        job_id = data.get("id")
         return cls(
-            id=UUID(data["id"]) if data.get("id") else None,
+            id=UUID(job_id) if job_id else None,
             client_id=UUID(data["client_id"]),
             business_name=data["business_name"],
             location=data.get("location", ""),
@@ -245,19 +279,25 @@ class ScheduledJob:
             schedule_day=data.get("schedule_day"),
             schedule_hour=data["schedule_hour"],
             is_active=data.get("is_active", True),
-            last_run=datetime.fromisoformat(data["last_run"]) if data.get("last_run") else None,
-            next_run=datetime.fromisoformat(data["next_run"]) if data.get("next_run") else None,
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
+            last_run=_parse_timestamp(data.get("last_run")),
+            next_run=_parse_timestamp(data.get("next_run")),
+            created_at=_parse_timestamp(data.get("created_at")),
         )
 
-    def get_cron_trigger(self) -> CronTrigger:
-        """Get APScheduler CronTrigger for this job's schedule."""
+    @cached_property
+    def cron_trigger(self) -> CronTrigger:
+        """APScheduler CronTrigger for this job's schedule.
+
+        Built once per job: reloads and re-adds reuse the same trigger.
+        Assigning schedule_day drops it so the next access rebuilds it.
+        The clients route changes frequency and schedule_hour on a fresh
+        job built for the update, so those need no invalidation.
+        """
         if self.frequency == "daily":
             return CronTrigger(hour=self.schedule_hour, minute=0)
         elif self.frequency == "weekly":
-            day_of_week = DAY_TO_CRON.get(self.schedule_day, 0)
             return CronTrigger(
-                day_of_week=day_of_week,
+                day_of_week=self._schedule_day_idx or 0,
                 hour=self.schedule_hour,
                 minute=0,
             )
@@ -270,44 +310,53 @@ class ScheduledJob:
         else:
             raise ValueError(f"Unknown frequency: {self.frequency}")
 
+    def get_cron_trigger(self) -> CronTrigger:
+        """Get APScheduler CronTrigger for this job's schedule."""
+        return self.cron_trigger
+
     def calculate_next_run(self) -> datetime:
         """Calculate the next run time based on schedule."""
         now = datetime.now(timezone.utc)
 
         if self.frequency == "daily":
             # Next occurrence at schedule_hour
-            next_run = now.replace(hour=self.schedule_hour, minute=0, second=0, microsecond=0)
+            next_run = _at_hour(now, self.schedule_hour)
             if next_run <= now:
                 next_run += timedelta(days=1)
             return next_run
 
         elif self.frequency == "weekly":
             # Next occurrence on schedule_day at schedule_hour
-            target_day = DAY_TO_CRON.get(self.schedule_day, 0)
-            current_day = now.weekday()
-            days_ahead = target_day - current_day
+            days_ahead = (self._schedule_day_idx or 0) - now.weekday()
             if days_ahead < 0 or (days_ahead == 0 and now.hour >= self.schedule_hour):
                 days_ahead += 7
-            next_run = now + timedelta(days=days_ahead)
-            next_run = next_run.replace(hour=self.schedule_hour, minute=0, second=0, microsecond=0)
-            return next_run
+            return _at_hour(now, self.schedule_hour) + timedelta(days=days_ahead)
 
         elif self.frequency == "monthly":
             # Next occurrence on 1st of month at schedule_hour
             if now.day == 1 and now.hour < self.schedule_hour:
-                next_run = now.replace(hour=self.schedule_hour, minute=0, second=0, microsecond=0)
-            else:
-                # Move to first of next month
-                if now.month == 12:
-                    next_run = now.replace(year=now.year + 1, month=1, day=1)
-                else:
-                    next_run = now.replace(month=now.month + 1, day=1)
-                next_run = next_run.replace(hour=self.schedule_hour, minute=0, second=0, microsecond=0)
-            return next_run
+                return _at_hour(now, self.schedule_hour)
+            # Move to first of next month
+            if now.month == 12:
+                return datetime(now.year + 1, 1, 1, self.schedule_hour, tzinfo=timezone.utc)
+            return datetime(now.year, now.month + 1, 1, self.schedule_hour, tzinfo=timezone.utc)
 
         return now
 
 
+# Columns ScheduledJob.from_dict reads. Selecting these rather than "*"
+# leaves updated_at (and any future columns) out of the response body.
+_JOB_COLUMNS = (
+    "id,client_id,business_name,location,owner_email,frequency,"
+    "schedule_day,schedule_hour,is_active,last_run,next_run,created_at"
+)
+
+
+def _fetch_jobs(query: Any) -> list[ScheduledJob]:
+    """Execute a scheduled_jobs select and build a ScheduledJob per row."""
+    return [ScheduledJob.from_dict(row) for row in (query.execute().data or [])]
+
+
 # =============================================================================
 # Scheduler Class
 # =============================================================================
@@ -354,7 +403,13 @@ class Scheduler:
         settings = get_settings()
         self._supabase_url = supabase_url or settings.supabase_url
         self._supabase_key = supabase_key or settings.supabase_key.get_secret_value()
+        self._http_limits = httpx.Limits(
+            max_connections=settings.supabase_max_connections,
+            max_keepalive_connections=settings.supabase_max_keepalive_connections,
+            keepalive_expiry=settings.supabase_keepalive_expiry,
+        )
 
+        self._http: Optional[httpx.Client] = None
         self._supabase: Optional[Client] = None
         self._scheduler: Optional[AsyncIOScheduler] = None
         self._is_running = False
@@ -369,9 +424,45 @@ class Scheduler:
     def _get_supabase(self) -> Client:
         """Get or create Supabase client."""
         if self._supabase is None:
-            self._supabase = create_client(self._supabase_url, self._supabase_key)
+            # One pooled client shared by every query. Idle connections
+            # outlive the gap between job runs, so run-time updates reuse
+            # the TCP+TLS session instead of reconnecting each time.
+            self._http = httpx.Client(
+                limits=self._http_limits,
+                timeout=httpx.Timeout(10.0, connect=2.0),
+                http2=True,
+                follow_redirects=True,
+            )
+            self._supabase = create_client(
+                self._supabase_url,
+                self._supabase_key,
+                options=ClientOptions(httpx_client=self._http),
+            )
         return self._supabase
 
+    def _close_supabase(self) -> None:
+        """Close the pooled HTTP connections and drop the Supabase client."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        self._supabase = None
+
+    async def _run_sync(self, func: Callable[..., T], /, *args: Any) -> T:
+        """Run a blocking supabase-py call in a worker thread.
+
+        supabase-py's Client is synchronous; awaiting it here keeps the
+        HTTP round trip from stalling APScheduler's event loop and any
+        running _execute_job coroutines.
+
+        Args:
+            func: Usually a built query's bound ``execute`` method.
+            *args: Positional arguments for func.
+
+        Returns:
+            Whatever func returns.
+        """
+        return await asyncio.to_thread(func, *args)
+
     async def start(self) -> None:
         """Start the scheduler and load all active jobs from Supabase."""
         if self._is_running:
@@ -415,6 +506,7 @@ class Scheduler:
             self._scheduler.shutdown(wait=True)
             self._scheduler = None
 
+        self._close_supabase()
         self._is_running = False
         logger.info("scheduler_stopped")
 
@@ -423,14 +515,24 @@ class Scheduler:
         supabase = self._get_supabase()
 
         try:
-            result = supabase.table("scheduled_jobs").select("*").eq("is_active", True).execute()
-            jobs = result.data or []
+            # Parse rows in the worker thread as well, keeping it off the loop
+            jobs = await self._run_sync(
+                _fetch_jobs,
+                supabase.table("scheduled_jobs")
+                .select(_JOB_COLUMNS)
+                .eq("is_active", True)
+            )
 
             logger.info("loading_jobs_from_supabase", count=len(jobs))
 
-            for job_data in jobs:
-                job = ScheduledJob.from_dict(job_data)
-                self._add_job_to_scheduler(job)
+            # Paused, add_job skips its per-job wakeup; resume() recomputes
+            # the next wakeup once for the whole batch.
+            self._scheduler.pause()
+            try:
+                for job in jobs:
+                    self._add_job_to_scheduler(job)
+            finally:
+                self._scheduler.resume()
 
             logger.info("jobs_loaded", count=len(jobs))
 
@@ -444,19 +546,13 @@ class Scheduler:
             logger.warning("scheduler_not_started")
             return
 
-        job_id = f"job_{job.client_id}"
-
-        # Remove existing job if present
-        existing = self._scheduler.get_job(job_id)
-        if existing:
-            self._scheduler.remove_job(job_id)
-
-        # Add job with cron trigger
+        # Add job with cron trigger; replace_existing swaps out any job
+        # already registered under this ID in the same store operation
         trigger = job.get_cron_trigger()
         self._scheduler.add_job(
             self._execute_job,
             trigger=trigger,
-            id=job_id,
+            id=f"job_{job.client_id}",
             args=[job],
             name=f"LocalPulse: {job.business_name}",
             replace_existing=True,
@@ -537,10 +633,12 @@ class Scheduler:
         supabase = self._get_supabase()
 
         try:
-            supabase.table("scheduled_jobs").update({
-                "last_run": job.last_run.isoformat() if job.last_run else None,
-                "next_run": job.next_run.isoformat() if job.next_run else None,
-            }).eq("client_id", str(job.client_id)).execute()
+            await self._run_sync(
+                supabase.table("scheduled_jobs").update({
+                    "last_run": job.last_run.isoformat() if job.last_run else None,
+                    "next_run": job.next_run.isoformat() if job.next_run else None,
+                }).eq("client_id", str(job.client_id)).execute
+            )
 
         except Exception as e:
             logger.error("update_run_times_failed", error=str(e))
@@ -574,11 +672,6 @@ class Scheduler:
         """
         supabase = self._get_supabase()
 
-        # Check if client already exists
-        existing = supabase.table("scheduled_jobs").select("id").eq("client_id", str(client_id)).execute()
-        if existing.data:
-            raise ValueError(f"Client {client_id} already has a scheduled job")
-
         # Create job
         job = ScheduledJob(
             client_id=client_id,
@@ -592,9 +685,11 @@ class Scheduler:
         )
         job.next_run = job.calculate_next_run()
 
-        # Save to Supabase
+        # Save to Supabase. The UNIQUE(client_id) constraint rejects
+        # duplicates, so no separate existence check (and no race between
+        # check and insert) is needed.
         try:
-            supabase.table("scheduled_jobs").insert(job.to_dict()).execute()
+            await self._run_sync(supabase.table("scheduled_jobs").insert(job.to_dict()).execute)
             logger.info(
                 "client_scheduled",
                 client_id=str(client_id),
@@ -603,6 +698,8 @@ class Scheduler:
                 next_run=job.next_run.isoformat(),
             )
         except Exception as e:
+            if isinstance(e, APIError) and e.code == _UNIQUE_VIOLATION:
+                raise ValueError(f"Client {client_id} already has a scheduled job") from e
             logger.error("schedule_client_failed", error=str(e))
             raise
 
@@ -624,7 +721,9 @@ class Scheduler:
         supabase = self._get_supabase()
 
         try:
-            result = supabase.table("scheduled_jobs").delete().eq("client_id", str(client_id)).execute()
+            result = await self._run_sync(
+                supabase.table("scheduled_jobs").delete().eq("client_id", str(client_id)).execute
+            )
 
             if not result.data:
                 logger.warning("remove_client_not_found", client_id=str(client_id))
@@ -653,8 +752,12 @@ class Scheduler:
         supabase = self._get_supabase()
 
         try:
-            result = supabase.table("scheduled_jobs").select("*").order("created_at").execute()
-            jobs = [ScheduledJob.from_dict(data) for data in (result.data or [])]
+            jobs = await self._run_sync(
+                _fetch_jobs,
+                supabase.table("scheduled_jobs")
+                .select(_JOB_COLUMNS)
+                .order("created_at")
+            )
 
             logger.info("list_jobs", count=len(jobs))
             return jobs
@@ -678,7 +781,12 @@ class Scheduler:
         supabase = self._get_supabase()
 
         # Get job from Supabase
-        result = supabase.table("scheduled_jobs").select("*").eq("client_id", str(client_id)).execute()
+        result = await self._run_sync(
+            supabase.table("scheduled_jobs")
+            .select(_JOB_COLUMNS)
+            .eq("client_id", str(client_id))
+            .execute
+        )
 
         if not result.data:
             raise ValueError(f"Client {client_id} not found")
@@ -719,9 +827,11 @@ class Scheduler:
         supabase = self._get_supabase()
 
         try:
-            result = supabase.table("scheduled_jobs").update({
-                "is_active": False,
-            }).eq("client_id", str(client_id)).execute()
+            result = await self._run_sync(
+                supabase.table("scheduled_jobs").update({
+                    "is_active": False,
+                }).eq("client_id", str(client_id)).execute
+            )
 
             if not result.data:
                 logger.warning("pause_client_not_found", client_id=str(client_id))
@@ -754,7 +864,12 @@ class Scheduler:
 
         try:
             # Get job data
-            result = supabase.table("scheduled_jobs").select("*").eq("client_id", str(client_id)).execute()
+            result = await self._run_sync(
+                supabase.table("scheduled_jobs")
+                .select(_JOB_COLUMNS)
+                .eq("client_id", str(client_id))
+                .execute
+            )
 
             if not result.data:
                 logger.warning("resume_client_not_found", client_id=str(client_id))
@@ -764,10 +879,12 @@ class Scheduler:
 
             # Update next_run and activate
             job.next_run = job.calculate_next_run()
-            supabase.table("scheduled_jobs").update({
-                "is_active": True,
-                "next_run": job.next_run.isoformat(),
-            }).eq("client_id", str(client_id)).execute()
+            await self._run_sync(
+                supabase.table("scheduled_jobs").update({
+                    "is_active": True,
+                    "next_run": job.next_run.isoformat(),
+                }).eq("client_id", str(client_id)).execute
+            )
 
             # Add back to scheduler
             if self._is_running:
@@ -792,7 +909,12 @@ class Scheduler:
         supabase = self._get_supabase()
 
         try:
-            result = supabase.table("scheduled_jobs").select("*").eq("client_id", str(client_id)).execute()
+            result = await self._run_sync(
+                supabase.table("scheduled_jobs")
+                .select(_JOB_COLUMNS)
+                .eq("client_id", str(client_id))
+                .execute
+            )
 
             if not result.data:
                 return None
@@ -7,7 +7,7 @@ for complete competitive intelligence workflows.
 from typing import Any, Dict, List, Optional
 import structlog
 
-from src.orchestration.discovery import AgentRegistry, AgentCard
+from src.orchestration.discovery import AgentCard, get_registry
 from src.agents.base import BaseAgent
 
 logger = structlog.get_logger(__name__)
@@ -135,7 +135,7 @@ class AgentWorkflow:
         self.agents: Dict[str, BaseAgent] = {}
         self.router = MessageRouter()
         self.orchestrator: Optional[Orchestrator] = None
-        self.registry = AgentRegistry()
+        self.registry = get_registry()
         self.logger = logger.bind(component="agent_workflow")
 
     async def initialize(self) -> None:
@@ -188,8 +188,13 @@ def mock_settings():
     settings.neo4j_uri = "bolt://localhost:7687"
     settings.neo4j_user = "neo4j"
     settings.neo4j_password.get_secret_value.return_value = "test"
+    settings.neo4j_database = "neo4j"
+    settings.neo4j_pool_size = 100
+    settings.neo4j_acquire_timeout = 60.0
+    settings.neo4j_max_connection_lifetime = 3600
     settings.pinecone_api_key.get_secret_value.return_value = "test-key"
     settings.pinecone_index_name = "test-index"
+    settings.pinecone_pool_size = 64
     settings.cohere_api_key.get_secret_value.return_value = "test-key"
     settings.redis_url = "redis://localhost:6379"
     settings.app_env = "development"
@@ -75,7 +75,7 @@ async def integration_container(mock_settings):
 
     container._pinecone = MagicMock()
     container._pinecone.connect = MagicMock()
-    container._pinecone.ensure_index = MagicMock()
+    container._pinecone.ensure_index = AsyncMock()
     container._pinecone.query = MagicMock(return_value=[])
 
     container._initialized = True
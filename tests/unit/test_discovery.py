@@ -0,0 +1,152 @@
+"""Unit tests for agent discovery.
+
+Tests AgentRegistry registration and capability lookup.
+"""
+
+from src.orchestration.discovery import AgentCard, AgentRegistry, get_registry
+
+
+def _card(agent_id, capabilities):
+    """Build an AgentCard with the given capabilities."""
+    return AgentCard(
+        agent_id=agent_id,
+        name=agent_id.title(),
+        description=f"{agent_id} agent",
+        capabilities=capabilities,
+    )
+
+
+class TestAgentCard:
+    """Tests for agent card serialization."""
+
+    def test_to_dict_built_once(self):
+        """Test the dictionary form is cached and holds every field."""
+        card = _card("research", ["search"])
+
+        data = card.to_dict()
+
+        assert card.to_dict() is data
+        assert data == {
+            "agent_id": "research",
+            "name": "Research",
+            "description": "research agent",
+            "capabilities": ["search"],
+            "input_schema": {},
+            "output_schema": {},
+        }
+        assert not hasattr(card, "__dict__")
+
+
+class TestFindByCapability:
+    """Tests for capability-based agent lookup."""
+
+    def test_returns_matching_cards_in_registration_order(self, clean_registry):
+        """Test every agent with the capability is returned, oldest first."""
+        registry = AgentRegistry()
+        registry.register_card(_card("research", ["data-collection", "search"]))
+        registry.register_card(_card("analysis", ["sentiment"]))
+        registry.register_card(_card("scraper", ["data-collection"]))
+
+        found = registry.find_by_capability("data-collection")
+
+        assert [card.agent_id for card in found] == ["research", "scraper"]
+
+    def test_unknown_capability_returns_empty(self, clean_registry):
+        """Test a capability nobody offers returns no cards."""
+        registry = AgentRegistry()
+        registry.register_card(_card("research", ["search"]))
+
+        assert registry.find_by_capability("translation") == []
+
+    def test_reregistering_replaces_capabilities(self, clean_registry):
+        """Test re-registering a card drops capabilities it no longer has."""
+        registry = AgentRegistry()
+        registry.register_card(_card("research", ["search"]))
+        registry.register_card(_card("research", ["data-collection"]))
+
+        assert registry.find_by_capability("search") == []
+        assert [c.agent_id for c in registry.find_by_capability("data-collection")] == [
+            "research"
+        ]
+
+    def test_reregistering_keeps_registration_order(self, clean_registry):
+        """Test a re-registered agent keeps its place and leaves no empty entries."""
+        registry = AgentRegistry()
+        registry.register_card(_card("research", ["search"]))
+        registry.register_card(_card("scraper", ["data-collection", "search"]))
+        registry.register_card(_card("research", ["data-collection", "search"]))
+
+        for capability in ("search", "data-collection"):
+            found = registry.find_by_capability(capability)
+            assert [card.agent_id for card in found] == ["research", "scraper"]
+
+        registry.register_card(_card("research", ["sentiment"]))
+
+        assert registry._capability_index == {
+            "data-collection": {"scraper": None},
+            "search": {"scraper": None},
+            "sentiment": {"research": None},
+        }
+
+    def test_unregister_card_cleans_index(self, clean_registry):
+        """Test unregistering removes the card, agent and its index entries."""
+        registry = AgentRegistry()
+        registry.register_card(_card("research", ["data-collection", "search"]))
+        registry.register_card(_card("scraper", ["data-collection"]))
+        registry.register_agent("research", object())
+
+        assert registry.unregister_card("research") is True
+
+        assert registry.get_card("research") is None
+        assert registry.get_agent("research") is None
+        assert registry.find_by_capability("search") == []
+        assert [c.agent_id for c in registry.find_by_capability("data-collection")] == [
+            "scraper"
+        ]
+        assert registry._capability_index == {"data-collection": {"scraper": None}}
+        assert registry.unregister_card("research") is False
+
+    def test_reset_clears_index(self, clean_registry):
+        """Test resetting the registry forgets indexed capabilities."""
+        AgentRegistry().register_card(_card("research", ["search"]))
+
+        AgentRegistry.reset_registry()
+
+        assert AgentRegistry().find_by_capability("search") == []
+
+
+class TestViews:
+    """Tests for the allocation-free registry views."""
+
+    def test_views_track_registrations(self, clean_registry):
+        """Test the views reflect cards registered after they were taken."""
+        registry = AgentRegistry()
+        ids = registry.list_agents_iter()
+        cards = registry.get_all_cards_view()
+
+        registry.register_card(_card("research", ["search"]))
+
+        assert list(ids) == ["research"]
+        assert [card.agent_id for card in cards] == ["research"]
+        assert list(cards) == registry.get_all_cards()
+
+
+class TestGetRegistry:
+    """Tests for the singleton accessor."""
+
+    def test_returns_singleton(self, clean_registry):
+        """Test get_registry and AgentRegistry() share one instance."""
+        registry = get_registry()
+
+        assert registry is AgentRegistry()
+        assert get_registry() is registry
+
+    def test_follows_reset(self, clean_registry):
+        """Test a reset registry is replaced by a fresh, empty one."""
+        old = get_registry()
+        old.register_card(_card("research", ["search"]))
+
+        AgentRegistry.reset_registry()
+
+        assert get_registry() is not old
+        assert get_registry().list_agents() == []
@@ -3,6 +3,7 @@
 Tests ErrorMetricsStore with in-memory backend and mocked Redis.
 """
 
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -44,6 +45,12 @@ class TestErrorRecord:
         assert record.message == ""
         assert record.context == {}
 
+    def test_error_record_has_no_instance_dict(self):
+        """Test ErrorRecord uses slots rather than a per-instance __dict__."""
+        record = ErrorRecord(error_type="TestError", endpoint="/test", timestamp=1000.0)
+
+        assert not hasattr(record, "__dict__")
+
 
 class TestErrorMetricsStore:
     """Tests for ErrorMetricsStore with in-memory backend."""
@@ -173,6 +180,32 @@ class TestErrorMetricsStore:
         for error in errors:
             assert error["endpoint"] == "/api/endpoint1"
 
+    @pytest.mark.asyncio
+    async def test_get_errors_by_endpoint_newest_first_with_limit(self, store):
+        """Test endpoint errors come back newest first, capped at limit."""
+        for i in range(3):
+            with patch("src.monitoring.error_metrics.time.time", return_value=1000.0 + i):
+                await store.record_error(f"Error{i}", "/api/endpoint1")
+
+        with patch("src.monitoring.error_metrics.time.time", return_value=1010.0):
+            errors = await store.get_errors_by_endpoint("/api/endpoint1", limit=2)
+
+        assert [e["error_type"] for e in errors] == ["Error2", "Error1"]
+
+    @pytest.mark.asyncio
+    async def test_expired_records_are_dropped(self, store):
+        """Test records older than the retention window are evicted on write."""
+        with patch("src.monitoring.error_metrics.time.time", return_value=1000.0):
+            await store.record_error("OldError", "/test")
+        with patch(
+            "src.monitoring.error_metrics.time.time",
+            return_value=1000.0 + store.retention_seconds + 1,
+        ):
+            await store.record_error("OldError", "/test")
+
+        assert len(store._memory_store["OldError"]) == 1
+        assert await store.get_total_error_count("OldError") == 2
+
     @pytest.mark.asyncio
     async def test_redis_fallback_on_failure(self):
         """Test graceful fallback when Redis unavailable."""
@@ -186,6 +219,121 @@ class TestErrorMetricsStore:
         assert store._use_redis is False  # Should have switched to in-memory
 
 
+def _redis_store():
+    """Create a store wired to a mocked Redis client."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe
+    redis.register_script.return_value = AsyncMock(return_value=1)
+
+    store = ErrorMetricsStore(redis_url="redis://localhost:6379")
+    store._redis = redis
+    return store, redis, pipe
+
+
+class TestRedisBackend:
+    """Tests for ErrorMetricsStore with a mocked Redis backend."""
+
+    @pytest.mark.asyncio
+    async def test_record_error_stores_json_member(self):
+        """Test the record is written by one script call scored by timestamp."""
+        store, redis, pipe = _redis_store()
+        script = redis.register_script.return_value
+
+        await store.record_error("ValidationError", "/api/test", "Bad", {"field": "email"})
+
+        call = script.await_args.kwargs
+        assert call["keys"] == [
+            "errors:ValidationError",
+            "errors:by_endpoint:api_test",
+            "errors:counts:ValidationError",
+            "errors:types",
+        ]
+        member, timestamp, cutoff, error_type = call["args"]
+        assert error_type == "ValidationError"
+        assert orjson.loads(member) == {
+            "error_type": "ValidationError",
+            "endpoint": "/api/test",
+            "timestamp": timestamp,
+            "message": "Bad",
+            "context": {"field": "email"},
+        }
+        assert timestamp - cutoff == pytest.approx(store.retention_seconds)
+        pipe.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_record_script_registered_once(self):
+        """Test the Lua script is registered on first use and then reused."""
+        store, redis, _ = _redis_store()
+
+        await store.record_error("A", "/test")
+        await store.record_error("B", "/test")
+
+        redis.register_script.assert_called_once()
+        assert redis.register_script.return_value.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_errors_by_endpoint_decodes_members(self):
+        """Test stored members are decoded back into dictionaries."""
+        store, redis, _ = _redis_store()
+        redis.zrangebyscore = AsyncMock(
+            return_value=['{"error_type": "E", "endpoint": "/api/test", "timestamp": 1.0}']
+        )
+
+        errors = await store.get_errors_by_endpoint("/api/test")
+
+        assert errors == [{"error_type": "E", "endpoint": "/api/test", "timestamp": 1.0}]
+        assert redis.zrangebyscore.call_args.args[0] == "errors:by_endpoint:api_test"
+
+
+    @pytest.mark.asyncio
+    async def test_get_top_errors_counts_in_one_pipeline(self):
+        """Test per-type counts are batched into a single pipeline round trip."""
+        store, redis, pipe = _redis_store()
+        redis.smembers = AsyncMock(return_value={"A", "B", "C"})
+        counts = {"errors:A": 3, "errors:B": 0, "errors:C": 7}
+        pipe.execute.side_effect = lambda: [
+            counts[call.args[0]] for call in pipe.zcount.call_args_list
+        ]
+
+        top = await store.get_top_errors(limit=5)
+
+        assert top == [("C", 7), ("A", 3)]
+        assert pipe.zcount.call_count == 3
+        pipe.execute.assert_awaited_once()
+        redis.smembers.assert_awaited_once_with("errors:types")
+
+
+    @pytest.mark.asyncio
+    async def test_get_error_trend_counts_in_one_pipeline(self):
+        """Test bucket counts are batched into a single pipeline round trip."""
+        store, _, pipe = _redis_store()
+        pipe.execute.return_value = [1, 0, 4]
+
+        trend = await store.get_error_trend("TrendError", bucket_minutes=5, buckets=3)
+
+        assert [count for _, count in trend] == [1, 0, 4]
+        starts = [start for start, _ in trend]
+        assert starts[1] - starts[0] == pytest.approx(300)
+        assert [call.args[1] for call in pipe.zcount.call_args_list] == starts
+        pipe.execute.assert_awaited_once()
+
+
+    @pytest.mark.asyncio
+    async def test_connected_store_skips_connection_check(self):
+        """Test a connected store uses its client without awaiting _get_redis."""
+        store, redis, _ = _redis_store()
+        store._connected = True
+        redis.zcount = AsyncMock(return_value=4)
+
+        with patch.object(store, "_get_redis", new=AsyncMock()) as get_redis:
+            count = await store.get_error_count("ValidationError")
+
+        assert count == 4
+        get_redis.assert_not_awaited()
+
+
 class TestErrorMetricsSingleton:
     """Tests for singleton pattern."""
 
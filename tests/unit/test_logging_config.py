@@ -0,0 +1,44 @@
+"""Unit tests for structlog configuration.
+
+Tests that configure_logging filters calls below the configured level.
+"""
+
+import structlog
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.monitoring.logging_config import configure_logging
+
+
+@pytest.fixture(autouse=True)
+def restore_structlog():
+    """Put structlog back to its defaults after each test."""
+    yield
+    structlog.reset_defaults()
+
+
+class TestConfigureLogging:
+    """Tests for level-filtered structlog loggers."""
+
+    def test_drops_calls_below_level(self, capsys):
+        """Test calls below the level print nothing and those at it still print."""
+        configure_logging("WARNING")
+        logger = structlog.get_logger("test")
+
+        logger.info("filtered_event")
+        logger.warning("kept_event")
+
+        out = capsys.readouterr().out
+        assert "filtered_event" not in out
+        assert "kept_event" in out
+
+    def test_defaults_to_settings_level(self, capsys):
+        """Test the settings log level is used when none is given."""
+        settings = MagicMock(log_level="ERROR")
+        with patch("src.config.settings.get_settings", return_value=settings):
+            configure_logging()
+        logger = structlog.get_logger("test")
+
+        logger.warning("warning_event")
+
+        assert "warning_event" not in capsys.readouterr().out
@@ -0,0 +1,176 @@
+"""Unit tests for Prometheus metric helpers.
+
+Tests metric recording against the real prometheus_client registry.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.monitoring import metrics
+from src.monitoring.metrics import (
+    AGENT_EXECUTION_DURATION,
+    AGENT_EXECUTION_TOTAL,
+    API_REQUEST_TOTAL,
+    CIRCUIT_BREAKER_STATE,
+    ERROR_COUNT,
+    KNOWLEDGE_STORE_OPERATIONS,
+    RATE_LIMIT_HITS,
+    record_error,
+    record_rate_limit_hit,
+    track_agent_execution,
+    track_api_request,
+    track_knowledge_store_operation,
+    update_circuit_breaker_state,
+)
+
+
+class TestLabelChildren:
+    """Tests for cached label-bound metric children."""
+
+    @pytest.mark.asyncio
+    async def test_record_error_increments_labelled_counter(self):
+        """Test each call increments the same labelled child."""
+        child = ERROR_COUNT.labels(error_type="CachedError", endpoint="/cached")
+        before = child._value.get()
+
+        await record_error("CachedError", "/cached", persist=False)
+        await record_error("CachedError", "/cached", persist=False)
+
+        assert child._value.get() == before + 2
+
+    def test_rate_limit_hit_increments_labelled_counter(self):
+        """Test rate limit hits land on the API's child counter."""
+        child = RATE_LIMIT_HITS.labels(api_name="cached_api")
+        before = child._value.get()
+
+        record_rate_limit_hit("cached_api")
+
+        assert child._value.get() == before + 1
+
+
+    def test_circuit_breaker_state_values(self):
+        """Test breaker states map onto gauge values, unknown states to closed."""
+        gauge = CIRCUIT_BREAKER_STATE.labels(service="cached_service")
+
+        update_circuit_breaker_state("cached_service", "open")
+        assert gauge._value.get() == 2
+        update_circuit_breaker_state("cached_service", "half_open")
+        assert gauge._value.get() == 1
+        update_circuit_breaker_state("cached_service", "unknown")
+        assert gauge._value.get() == 0
+
+
+class TestTrackers:
+    """Tests for the tracking context managers."""
+
+    def test_agent_success_and_error_counted_separately(self):
+        """Test successes and failures land on their own status children."""
+        success = AGENT_EXECUTION_TOTAL.labels(agent="tracked", status="success")
+        error = AGENT_EXECUTION_TOTAL.labels(agent="tracked", status="error")
+        success_before, error_before = success._value.get(), error._value.get()
+
+        with track_agent_execution("tracked"):
+            pass
+        with pytest.raises(RuntimeError):
+            with track_agent_execution("tracked"):
+                raise RuntimeError("boom")
+
+        assert success._value.get() == success_before + 1
+        assert error._value.get() == error_before + 1
+        assert AGENT_EXECUTION_DURATION.labels(agent="tracked")._sum.get() >= 0
+
+    def test_api_request_uses_status_set_by_caller(self):
+        """Test the request is counted under the status code the caller set."""
+        child = API_REQUEST_TOTAL.labels(method="GET", endpoint="/tracked", status_code="204")
+        before = child._value.get()
+
+        with track_api_request("GET", "/tracked") as ctx:
+            ctx["status_code"] = 204
+
+        assert child._value.get() == before + 1
+
+    def test_api_request_defaults_to_500(self):
+        """Test a request whose caller never sets a status is counted as 500."""
+        child = API_REQUEST_TOTAL.labels(method="GET", endpoint="/unset", status_code="500")
+        before = child._value.get()
+
+        with track_api_request("GET", "/unset"):
+            pass
+
+        assert child._value.get() == before + 1
+
+    def test_api_request_accepts_string_status(self):
+        """Test a status code set as a string is used as-is."""
+        child = API_REQUEST_TOTAL.labels(method="POST", endpoint="/tracked", status_code="201")
+        before = child._value.get()
+
+        with track_api_request("POST", "/tracked") as ctx:
+            ctx["status_code"] = "201"
+
+        assert child._value.get() == before + 1
+
+    def test_knowledge_store_error_status(self):
+        """Test a failing store operation is counted as an error."""
+        child = KNOWLEDGE_STORE_OPERATIONS.labels(
+            store="neo4j", operation="tracked", status="error"
+        )
+        before = child._value.get()
+
+        with pytest.raises(ValueError):
+            with track_knowledge_store_operation("neo4j", "tracked"):
+                raise ValueError("bad query")
+
+        assert child._value.get() == before + 1
+
+
+class TestDisabledTrackers:
+    """Tests for the METRICS_DISABLED fast path."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("true", True),
+        ("1", True),
+        ("false", False),
+        ("", False),
+    ])
+    def test_env_flag(self, monkeypatch, value, expected):
+        """Test the environment flag is parsed leniently."""
+        monkeypatch.setenv("METRICS_DISABLED", value)
+
+        assert metrics._metrics_disabled() is expected
+
+    def test_noop_tracker_accepts_api_context(self):
+        """Test the no-op tracker takes any arguments and tolerates ctx writes."""
+        tracker = metrics._noop_tracker("GET", endpoint="/noop")
+
+        with tracker as ctx:
+            ctx["status_code"] = 200
+
+        assert metrics._noop_tracker("research") is tracker
+
+
+class TestMetricsEndpoint:
+    """Tests for serving the Prometheus exposition body."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        """Start each test with an expired body cache."""
+        metrics._metrics_cache = (float("-inf"), b"")
+        yield
+        metrics._metrics_cache = (float("-inf"), b"")
+
+    def test_body_reused_within_ttl(self):
+        """Test scrapes inside the TTL reuse the rendered body."""
+        with patch.object(metrics, "generate_latest", return_value=b"body") as generate, \
+                patch.object(metrics.time, "monotonic", side_effect=[100.0, 101.0]):
+            assert metrics._render_metrics() == b"body"
+            assert metrics._render_metrics() == b"body"
+
+        generate.assert_called_once()
+
+    def test_body_regenerated_after_ttl(self):
+        """Test a scrape after the TTL renders a fresh body."""
+        ttl = metrics.METRICS_CACHE_TTL_SECONDS
+        with patch.object(metrics, "generate_latest", side_effect=[b"old", b"new"]), \
+                patch.object(metrics.time, "monotonic", side_effect=[100.0, 100.0 + ttl]):
+            assert metrics._render_metrics() == b"old"
+            assert metrics._render_metrics() == b"new"
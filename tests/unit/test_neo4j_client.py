@@ -0,0 +1,521 @@
+"""Unit tests for the Neo4j client.
+
+Tests query execution paths against a mocked driver (no database needed).
+"""
+
+import asyncio
+
+import orjson
+import pytest
+from neo4j import RoutingControl
+from neo4j.exceptions import ServiceUnavailable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.config import settings
+from src.core.circuit_breaker import get_circuit_breaker
+from src.core.exceptions import (
+    KnowledgeStoreConnectionError,
+    KnowledgeStoreError,
+    KnowledgeStoreQueryError,
+)
+from src.knowledge.neo4j_client import (
+    Neo4jClient,
+    PreparedQuery,
+    _SCHEMA_STATEMENTS,
+    _cypher_fingerprint,
+    _now_iso_cached,
+    _track_query_fingerprint,
+    close_shared_drivers,
+)
+
+
+def _make_client(records=None):
+    """Create a client wired to a mocked driver returning the given records.
+
+    Returns the client and the mocked driver; driver.session() returns a
+    mocked session for streaming queries.
+    """
+    records = records if records is not None else [{"name": "Test"}]
+
+    record_objs = []
+    for data in records:
+        record = MagicMock()
+        record.data.return_value = data
+        record_objs.append(record)
+
+    async def _aiter():
+        for record in record_objs:
+            yield record
+
+    result = MagicMock()
+    result.data = AsyncMock(side_effect=lambda: [dict(r) for r in records])
+    result.consume = AsyncMock()
+    result.__aiter__ = lambda self: _aiter()
+
+    session = MagicMock()
+    session.run = AsyncMock(return_value=result)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+
+    driver = MagicMock()
+    driver.session.return_value = session
+    driver.execute_query = AsyncMock(return_value=MagicMock(records=record_objs))
+
+    client = Neo4jClient(uri="bolt://localhost:7687", user="neo4j", password="test", database="neo4j")
+    client._driver = driver
+    return client, driver
+
+
+@pytest.fixture(autouse=True)
+def reset_breaker():
+    """Keep the shared Neo4j circuit breaker closed between tests."""
+    get_circuit_breaker("neo4j").reset()
+    yield
+    get_circuit_breaker("neo4j").reset()
+
+
+class TestSchemaStatements:
+    """Tests for the precomputed schema statement list."""
+
+    def test_comments_are_stripped(self):
+        """No statement should start with (or contain) a comment line."""
+        assert all("//" not in stmt for stmt in _SCHEMA_STATEMENTS)
+
+    def test_first_statement_of_each_group_kept(self):
+        """Statements following a comment header are not dropped."""
+        assert any("business_id" in stmt for stmt in _SCHEMA_STATEMENTS)
+        assert any("theme_id" in stmt for stmt in _SCHEMA_STATEMENTS)
+
+
+class TestCypherFingerprint:
+    """Tests for query fingerprinting."""
+
+    def test_whitespace_insensitive(self):
+        """Test indentation differences produce the same fingerprint."""
+        assert _cypher_fingerprint("MATCH (n)\n    RETURN n") == _cypher_fingerprint(
+            "  MATCH (n) RETURN n "
+        )
+
+    def test_inlined_values_differ(self):
+        """Test queries with different inlined literals are distinct."""
+        assert _cypher_fingerprint("MATCH (n {id: 1}) RETURN n") != _cypher_fingerprint(
+            "MATCH (n {id: 2}) RETURN n"
+        )
+
+    def test_comment_lines_ignored(self):
+        """Test // comment lines don't change the fingerprint."""
+        assert _cypher_fingerprint(
+            "// Find businesses\nMATCH (n:Business)\n  // by any id\nRETURN n"
+        ) == _cypher_fingerprint("MATCH (n:Business) RETURN n")
+
+    def test_repeated_query_not_rehashed(self):
+        """Test a query text seen before skips normalizing and hashing."""
+        query = "MATCH (n:RepeatedFingerprintTest) RETURN n"
+
+        with patch(
+            "src.knowledge.neo4j_client._cypher_fingerprint", wraps=_cypher_fingerprint
+        ) as fingerprint:
+            _track_query_fingerprint(query)
+            _track_query_fingerprint(query)
+
+        fingerprint.assert_called_once_with(query)
+
+
+class TestNowIsoCached:
+    """Tests for the cached ISO timestamp helper."""
+
+    def test_reused_within_resolution(self):
+        """Test calls inside the window return the same string."""
+        assert _now_iso_cached(resolution=60.0) == _now_iso_cached(resolution=60.0)
+
+    def test_refreshed_after_resolution(self):
+        """Test a zero resolution always formats a fresh timestamp."""
+        with patch("src.knowledge.neo4j_client.datetime") as mock_datetime:
+            mock_datetime.now.return_value.isoformat.side_effect = ["first", "second"]
+
+            assert _now_iso_cached(resolution=0.0) == "first"
+            assert _now_iso_cached(resolution=0.0) == "second"
+
+
+class TestRunQuery:
+    """Tests for run_query and its result cache."""
+
+    @pytest.mark.asyncio
+    async def test_run_query_returns_records(self):
+        """Test records are returned as dictionaries."""
+        client, driver = _make_client([{"name": "A"}, {"name": "B"}])
+
+        records = await client.run_query("MATCH (b:Business) RETURN b.name AS name")
+
+        assert records == [{"name": "A"}, {"name": "B"}]
+        driver.execute_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_routes_to_writer_by_default(self):
+        """Test queries go to the leader unless marked read-only."""
+        client, driver = _make_client()
+
+        await client.run_query("MATCH (n) RETURN n")
+        await client.run_query("MATCH (n) RETURN n", read_only=True)
+
+        routes = [call.kwargs["routing_"] for call in driver.execute_query.await_args_list]
+        assert routes == [RoutingControl.WRITE, RoutingControl.READ]
+
+    @pytest.mark.asyncio
+    async def test_uncached_by_default(self):
+        """Test identical queries hit the database when cache is not requested."""
+        client, driver = _make_client()
+
+        await client.run_query("MATCH (n) RETURN n")
+        await client.run_query("MATCH (n) RETURN n")
+
+        assert driver.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self):
+        """Test cached reads are served without another round trip."""
+        client, driver = _make_client()
+
+        first = await client.run_query("MATCH (n) RETURN n", {"id": 1}, cache=True, read_only=True)
+        second = await client.run_query("MATCH (n) RETURN n", {"id": 1}, cache=True, read_only=True)
+
+        assert first == second
+        assert driver.execute_query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_returns_copies(self):
+        """Test mutating a cached result does not corrupt the cache."""
+        client, _ = _make_client([{"name": "A"}])
+
+        first = await client.run_query("MATCH (n) RETURN n", cache=True, read_only=True)
+        first[0]["name"] = "mutated"
+        second = await client.run_query("MATCH (n) RETURN n", cache=True, read_only=True)
+
+        assert second == [{"name": "A"}]
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_parameters(self):
+        """Test different parameters are cached separately."""
+        client, driver = _make_client()
+
+        await client.run_query(
+            "MATCH (n {id: $id}) RETURN n", {"id": 1}, cache=True, read_only=True
+        )
+        await client.run_query(
+            "MATCH (n {id: $id}) RETURN n", {"id": 2}, cache=True, read_only=True
+        )
+
+        assert driver.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_expires_after_ttl(self):
+        """Test entries older than the TTL are refetched."""
+        client, driver = _make_client()
+        client._cache_ttl = 0.0
+
+        await client.run_query("MATCH (n) RETURN n", cache=True, read_only=True)
+        await client.run_query("MATCH (n) RETURN n", cache=True, read_only=True)
+
+        assert driver.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Test the cache never grows beyond its max size."""
+        client, _ = _make_client()
+        client._cache_max_size = 2
+
+        for i in range(3):
+            await client.run_query(
+                "MATCH (n {id: $id}) RETURN n", {"id": i}, cache=True, read_only=True
+            )
+
+        assert len(client._result_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache(self):
+        """Test a write query clears cached read results."""
+        client, driver = _make_client()
+
+        await client.run_query("MATCH (n) RETURN n", cache=True, read_only=True)
+        await client.run_write_query("CREATE (n:Test)")
+
+        assert len(client._result_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_success_log_skipped_when_debug_disabled(self):
+        """Test the success-path debug log isn't built when debug is off."""
+        client, _ = _make_client()
+
+        with patch("src.knowledge.neo4j_client.logger") as mock_logger:
+            mock_logger.is_enabled_for.return_value = False
+            await client.run_query("MATCH (n) RETURN n")
+            await client.run_write_query("CREATE (n:Test)")
+
+        mock_logger.debug.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_query_write_invalidates_cache(self):
+        """Test a writer-routed run_query makes the next cached read hit the database."""
+        client, driver = _make_client()
+
+        await client.run_query("MATCH (n) RETURN n", cache=True, read_only=True)
+        await client.run_query("MERGE (n:Test {id: $id}) SET n.seen = true", {"id": 1})
+        await client.run_query("MATCH (n) RETURN n", cache=True, read_only=True)
+
+        assert driver.execute_query.await_count == 3
+
+
+class TestRunMany:
+    """Tests for concurrent independent queries."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self):
+        """Test one result list is returned per query, in order."""
+        client, driver = _make_client()
+        driver.execute_query.side_effect = [
+            MagicMock(records=[MagicMock(data=MagicMock(return_value={"i": i}))])
+            for i in range(3)
+        ]
+
+        results = await client.run_many([("RETURN $i AS i", {"i": i}) for i in range(3)])
+
+        assert results == [[{"i": 0}], [{"i": 1}], [{"i": 2}]]
+        assert driver.execute_query.await_count == 3
+
+
+class TestUpsertBusinesses:
+    """Tests for bulk business upserts."""
+
+    @pytest.mark.asyncio
+    async def test_rows_written_in_chunks(self):
+        """Test rows are sent as UNWIND batches of at most chunk_size."""
+        client, driver = _make_client([])
+        rows = [{"id": f"biz_{i}", "name": f"Business {i}"} for i in range(5)]
+
+        written = await client.upsert_businesses(rows, chunk_size=2)
+
+        assert written == 5
+        batches = [call.args[1]["rows"] for call in driver.execute_query.await_args_list]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert "UNWIND $rows" in driver.execute_query.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_skip_database(self):
+        """Test an empty upsert makes no round trip."""
+        client, driver = _make_client([])
+
+        assert await client.upsert_businesses([]) == 0
+        driver.execute_query.assert_not_awaited()
+
+
+class TestPreparedQuery:
+    """Tests for parameter-only prepared queries."""
+
+    def test_whitespace_is_normalized(self):
+        """Test differently indented queries produce the same text."""
+        first = PreparedQuery("MATCH (n)\n    RETURN n", frozenset({"id"}))
+        second = PreparedQuery("  MATCH (n) RETURN n  ", frozenset({"id"}))
+
+        assert first.cypher == "MATCH (n) RETURN n"
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_run_prepared_executes_normalized_query(self):
+        """Test run_prepared sends the normalized text and parameters."""
+        client, driver = _make_client()
+        prepared = PreparedQuery("MATCH (n {id: $id})\n RETURN n", frozenset({"id"}))
+
+        await client.run_prepared(prepared, {"id": 1})
+
+        args = driver.execute_query.await_args.args
+        assert args == ("MATCH (n {id: $id}) RETURN n", {"id": 1})
+
+    @pytest.mark.asyncio
+    async def test_missing_parameters_rejected(self):
+        """Test missing required parameters fail before reaching the driver."""
+        client, driver = _make_client()
+        prepared = PreparedQuery("MATCH (n {id: $id}) RETURN n", frozenset({"id"}))
+
+        with pytest.raises(KnowledgeStoreQueryError, match="id"):
+            await client.run_prepared(prepared, {})
+
+        driver.execute_query.assert_not_awaited()
+
+
+class TestCircuitBreakerGuard:
+    """Tests for circuit breaker accounting around queries."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_blocks_query(self):
+        """Test queries are rejected without touching the driver while open."""
+        client, driver = _make_client()
+        breaker = get_circuit_breaker("neo4j")
+        for _ in range(breaker.failure_threshold):
+            await breaker.record_failure()
+
+        with pytest.raises(KnowledgeStoreError) as exc_info:
+            await client.run_query("MATCH (n) RETURN n")
+
+        assert not isinstance(exc_info.value, KnowledgeStoreQueryError)
+        driver.execute_query.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded(self):
+        """Test a failed query counts against the breaker."""
+        client, driver = _make_client()
+        driver.execute_query.side_effect = RuntimeError("boom")
+
+        with pytest.raises(KnowledgeStoreQueryError):
+            await client.run_query("MATCH (n) RETURN n")
+
+        assert get_circuit_breaker("neo4j")._failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failures(self):
+        """Test a successful write clears the failure count."""
+        client, driver = _make_client()
+        await get_circuit_breaker("neo4j").record_failure()
+
+        await client.run_write_query("CREATE (n:Test)")
+
+        assert get_circuit_breaker("neo4j")._failure_count == 0
+
+
+class TestIterQuery:
+    """Tests for streaming query execution."""
+
+    @pytest.mark.asyncio
+    async def test_iter_query_yields_records(self):
+        """Test records are yielded one at a time."""
+        client, _ = _make_client([{"i": 0}, {"i": 1}, {"i": 2}])
+
+        records = [r async for r in client.iter_query("UNWIND range(0, 2) AS i RETURN i")]
+
+        assert records == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+    @pytest.mark.asyncio
+    async def test_run_query_json_encodes_records(self):
+        """Test records are returned as a JSON array of objects."""
+        client, _ = _make_client([{"name": "A", "rating": 4.5}])
+
+        payload = await client.run_query_json("MATCH (b:Business) RETURN b.name AS name")
+
+        assert orjson.loads(payload) == [{"name": "A", "rating": 4.5}]
+
+
+class TestSharedDriver:
+    """Tests for the process-wide driver shared across clients."""
+
+    @pytest.fixture
+    def mock_driver_factory(self):
+        """Patch driver construction and return the mocked factory."""
+        with patch("src.knowledge.neo4j_client.AsyncGraphDatabase.driver") as factory:
+            factory.side_effect = lambda *args, **kwargs: MagicMock(
+                verify_connectivity=AsyncMock(), close=AsyncMock()
+            )
+            yield factory
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_driver(self, mock_driver_factory):
+        """Test the second client reuses the first client's driver."""
+        first = Neo4jClient(uri="bolt://shared:7687", user="neo4j", password="test")
+        second = Neo4jClient(uri="bolt://shared:7687", user="neo4j", password="test")
+
+        await first.connect(auto_init_schema=False)
+        await second.connect(auto_init_schema=False)
+
+        assert first.driver is second.driver
+        assert mock_driver_factory.call_count == 1
+        first.driver.verify_connectivity.assert_awaited_once()
+        await close_shared_drivers()
+
+    @pytest.mark.asyncio
+    async def test_pool_configured_from_settings(self, mock_driver_factory):
+        """Test the driver pool is sized from settings with keep-alive on."""
+        client = Neo4jClient(uri="bolt://shared:7687", user="neo4j", password="test")
+        await client.connect(auto_init_schema=False)
+
+        kwargs = mock_driver_factory.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == settings.neo4j_pool_size
+        assert kwargs["connection_acquisition_timeout"] == settings.neo4j_acquire_timeout
+        assert kwargs["max_connection_lifetime"] == settings.neo4j_max_connection_lifetime
+        assert kwargs["keep_alive"] is True
+        await close_shared_drivers()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_without_closing_pool(self, mock_driver_factory):
+        """Test closing a client keeps the shared driver open."""
+        client = Neo4jClient(uri="bolt://shared:7687", user="neo4j", password="test")
+        await client.connect(auto_init_schema=False)
+        driver = client.driver
+
+        await client.close()
+
+        driver.close.assert_not_awaited()
+        await close_shared_drivers()
+        driver.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_discards_driver(self, mock_driver_factory):
+        """Test a driver that fails verification is not reused."""
+        mock_driver_factory.side_effect = None
+        broken = MagicMock(
+            verify_connectivity=AsyncMock(side_effect=RuntimeError("down")),
+            close=AsyncMock(),
+        )
+        mock_driver_factory.return_value = broken
+        client = Neo4jClient(uri="bolt://broken:7687", user="neo4j", password="test")
+
+        with pytest.raises(KnowledgeStoreConnectionError):
+            await client.connect(auto_init_schema=False)
+
+        broken.close.assert_awaited_once()
+        with pytest.raises(KnowledgeStoreConnectionError):
+            await client.connect(auto_init_schema=False)
+        assert mock_driver_factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connect_waits_for_verification(self, mock_driver_factory):
+        """Test a concurrent client never receives a driver that then fails."""
+        async def _fail_verification():
+            await asyncio.sleep(0)
+            raise ServiceUnavailable("down")
+
+        broken = MagicMock(
+            verify_connectivity=AsyncMock(side_effect=_fail_verification),
+            close=AsyncMock(),
+        )
+        healthy = MagicMock(verify_connectivity=AsyncMock(), close=AsyncMock())
+        mock_driver_factory.side_effect = [broken, healthy]
+        first = Neo4jClient(uri="bolt://racy:7687", user="neo4j", password="test")
+        second = Neo4jClient(uri="bolt://racy:7687", user="neo4j", password="test")
+
+        results = await asyncio.gather(
+            first.connect(auto_init_schema=False),
+            second.connect(auto_init_schema=False),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], KnowledgeStoreConnectionError)
+        assert results[1] is None
+        assert second.driver is healthy
+        broken.close.assert_awaited_once()
+        healthy.close.assert_not_awaited()
+        await close_shared_drivers()
+
+    @pytest.mark.asyncio
+    async def test_schema_init_runs_for_later_client(self, mock_driver_factory):
+        """Test skipping schema init on first connect doesn't skip it for good."""
+        first = Neo4jClient(uri="bolt://schema:7687", user="neo4j", password="test")
+        second = Neo4jClient(uri="bolt://schema:7687", user="neo4j", password="test")
+        third = Neo4jClient(uri="bolt://schema:7687", user="neo4j", password="test")
+
+        with patch.object(Neo4jClient, "_initialize_schema", AsyncMock()) as init_schema:
+            await first.connect(auto_init_schema=False)
+            init_schema.assert_not_awaited()
+
+            await second.connect()
+            await third.connect()
+
+        init_schema.assert_awaited_once()
+        await close_shared_drivers()
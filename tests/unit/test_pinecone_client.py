@@ -0,0 +1,214 @@
+"""Unit tests for the Pinecone client.
+
+Tests vector operations against a mocked index (no Pinecone account needed).
+"""
+
+import threading
+import time
+from array import array
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.circuit_breaker import get_circuit_breaker
+from src.knowledge.pinecone_client import PineconeClient
+
+
+def _make_client():
+    """Create a client wired to a mocked index."""
+    index = MagicMock()
+    index.upsert.side_effect = lambda vectors, namespace: MagicMock(
+        upserted_count=len(list(vectors))
+    )
+
+    client = PineconeClient(api_key="test-key", index_name="test-index")
+    client._client = MagicMock()
+    client._index = index
+    return client, index
+
+
+def _vectors(count):
+    """Build simple vector records."""
+    return [{"id": f"vec_{i}", "values": [0.1, 0.2], "metadata": {"i": i}} for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def reset_breaker():
+    """Keep the shared Pinecone circuit breaker closed between tests."""
+    get_circuit_breaker("pinecone").reset()
+    yield
+    get_circuit_breaker("pinecone").reset()
+
+
+class TestUpsertEmbeddings:
+    """Tests for batched vector upserts."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_all_batches(self):
+        """Test every vector is sent and counted across batches."""
+        client, index = _make_client()
+
+        result = await client.upsert_embeddings(_vectors(250), batch_size=100)
+
+        assert result == {"upserted_count": 250}
+        assert index.upsert.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test no more than `concurrency` batches are in flight at once."""
+        client, index = _make_client()
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def _slow_upsert(vectors, namespace):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return MagicMock(upserted_count=len(list(vectors)))
+
+        index.upsert.side_effect = _slow_upsert
+
+        await client.upsert_embeddings(_vectors(10), batch_size=1, concurrency=2)
+
+        assert 1 < peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_records_are_sent_without_copying(self):
+        """Test vector records are handed to the SDK as-is."""
+        client, index = _make_client()
+        vectors = _vectors(2)
+
+        await client.upsert_embeddings(vectors)
+
+        sent = index.upsert.call_args.kwargs["vectors"]
+        assert sent == vectors
+        assert sent[0] is vectors[0]
+
+    @pytest.mark.asyncio
+    async def test_array_values_are_converted_to_lists(self):
+        """Test array-like values are sent as plain lists."""
+        client, index = _make_client()
+        vectors = _vectors(2)
+        vectors[1]["values"] = array("f", [0.5, 0.25])
+
+        await client.upsert_embeddings(vectors)
+
+        sent = index.upsert.call_args.kwargs["vectors"]
+        assert sent[0] is vectors[0]
+        assert sent[1]["values"] == [0.5, 0.25]
+        assert isinstance(sent[1]["values"], list)
+
+
+class TestQuery:
+    """Tests for similarity queries."""
+
+    @pytest.mark.asyncio
+    async def test_matches_reuse_sdk_containers(self):
+        """Test metadata and values are passed through without copying."""
+        client, index = _make_client()
+        metadata = {"business_id": "biz_1"}
+        values = [0.1, 0.2]
+        index.query.return_value = MagicMock(
+            matches=[MagicMock(id="vec_1", score=0.9, metadata=metadata, values=values)]
+        )
+
+        results = await client.query([0.1, 0.2], top_k=1, include_values=True)
+
+        assert results == [{"id": "vec_1", "score": 0.9, "metadata": metadata, "values": values}]
+        assert results[0]["metadata"] is metadata
+        assert results[0]["values"] is values
+
+
+class TestDelete:
+    """Tests for vector deletion."""
+
+    @pytest.mark.asyncio
+    async def test_delete_all_takes_precedence(self):
+        """Test delete_all wins over ids and filter."""
+        client, index = _make_client()
+
+        await client.delete(ids=["vec_1"], namespace="ns", delete_all=True)
+
+        index.delete.assert_called_once_with(namespace="ns", delete_all=True)
+
+    @pytest.mark.asyncio
+    async def test_delete_by_filter(self):
+        """Test a filter is forwarded when no ids are given."""
+        client, index = _make_client()
+
+        await client.delete(filter={"business_id": "biz_1"})
+
+        index.delete.assert_called_once_with(namespace="", filter={"business_id": "biz_1"})
+
+    @pytest.mark.asyncio
+    async def test_noop_without_target(self):
+        """Test nothing is deleted when no target is given."""
+        client, index = _make_client()
+
+        await client.delete()
+
+        index.delete.assert_not_called()
+
+
+class TestGetStats:
+    """Tests for index statistics."""
+
+    @pytest.mark.asyncio
+    async def test_stats_are_fetched_off_the_loop(self):
+        """Test stats come from the SDK via the executor."""
+        client, index = _make_client()
+        index.describe_index_stats.return_value = MagicMock(
+            total_vector_count=3, dimension=1024, namespaces=None
+        )
+
+        with patch.object(client, "_run_sync", wraps=client._run_sync) as run_sync:
+            stats = await client.get_stats()
+
+        run_sync.assert_awaited_once_with(index.describe_index_stats)
+        assert stats == {"total_vector_count": 3, "dimension": 1024, "namespaces": {}}
+
+
+class TestEnsureIndex:
+    """Tests for index setup."""
+
+    @pytest.mark.asyncio
+    async def test_existing_index_is_not_recreated(self):
+        """Test an existing index is connected without listing all indexes."""
+        client, _ = _make_client()
+        client._client.has_index.return_value = True
+
+        await client.ensure_index()
+
+        client._client.has_index.assert_called_once_with(name="test-index")
+        client._client.list_indexes.assert_not_called()
+        client._client.create_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_index_is_created(self):
+        """Test a missing index is created before connecting."""
+        client, _ = _make_client()
+        client._client.has_index.return_value = False
+
+        await client.ensure_index(wait_for_ready=False)
+
+        client._client.create_index.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_polls_until_ready(self):
+        """Test readiness is polled with backoff until the index is ready."""
+        client, _ = _make_client()
+        client._client.describe_index.side_effect = [
+            MagicMock(status=MagicMock(ready=False)),
+            MagicMock(status=MagicMock(ready=True)),
+        ]
+
+        with patch("src.knowledge.pinecone_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            await client._wait_for_index_ready()
+
+        assert client._client.describe_index.call_count == 2
+        sleep.assert_awaited_once_with(0.5)
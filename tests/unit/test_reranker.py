@@ -0,0 +1,95 @@
+"""Unit tests for the Cohere reranker service.
+
+Tests reranking against a mocked Cohere client (no API calls).
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.knowledge.reranker import RerankerService
+
+
+def _make_service(results):
+    """Create a service whose client returns (index, score) rerank results."""
+    response = MagicMock()
+    response.results = [MagicMock(index=i, relevance_score=score) for i, score in results]
+
+    client = MagicMock()
+    client.rerank = AsyncMock(return_value=response)
+
+    service = RerankerService(api_key="test-key")
+    service._client = client
+    return service, client
+
+
+class TestSharedClient:
+    """Tests for the Cohere client shared across service instances."""
+
+    @pytest.mark.asyncio
+    async def test_instances_share_client(self):
+        """Test two services with the same key reuse one client."""
+        first = RerankerService(api_key="shared-key")
+        second = RerankerService(api_key="shared-key")
+
+        assert first.client is second.client
+        await RerankerService.aclose_all()
+
+    @pytest.mark.asyncio
+    async def test_different_keys_get_different_clients(self):
+        """Test clients are not shared across API keys."""
+        first = RerankerService(api_key="key-a")
+        second = RerankerService(api_key="key-b")
+
+        assert first.client is not second.client
+        await RerankerService.aclose_all()
+
+
+class TestRerank:
+    """Tests for rerank result mapping."""
+
+    @pytest.mark.asyncio
+    async def test_indices_map_back_past_empty_documents(self):
+        """Test result indices refer to the caller's list, skipping empties."""
+        service, client = _make_service([(1, 0.9), (0, 0.4)])
+
+        results = await service.rerank("food", ["pasta", "  ", "steak"], top_k=2)
+
+        assert client.rerank.await_args.kwargs["documents"] == ["pasta", "steak"]
+        assert results == [
+            {"index": 2, "score": 0.9, "text": "steak"},
+            {"index": 0, "score": 0.4, "text": "pasta"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_assume_nonempty_sends_documents_as_is(self):
+        """Test the fast path skips filtering and keeps indices unchanged."""
+        service, client = _make_service([(1, 0.8)])
+        documents = ["pasta", "steak"]
+
+        results = await service.rerank("food", documents, top_k=1, assume_nonempty=True)
+
+        assert client.rerank.await_args.kwargs["documents"] is documents
+        assert results == [{"index": 1, "score": 0.8, "text": "steak"}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_call(self):
+        """Test identical in-flight requests are coalesced into one API call."""
+        service, client = _make_service([(0, 0.9)])
+        response = client.rerank.return_value
+
+        async def _slow_rerank(**kwargs):
+            await asyncio.sleep(0.01)
+            return response
+
+        client.rerank = AsyncMock(side_effect=_slow_rerank)
+
+        results = await asyncio.gather(
+            service.rerank("food", ["pasta"], top_k=1),
+            service.rerank("food", ["pasta"], top_k=1),
+            service.rerank("service", ["pasta"], top_k=1),
+        )
+
+        assert results[0] == results[1]
+        assert client.rerank.await_count == 2
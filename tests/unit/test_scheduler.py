@@ -0,0 +1,312 @@
+"""Unit tests for the scheduler.
+
+Tests ScheduledJob scheduling and serialization, and Scheduler's
+Supabase access against a mock client (no Supabase needed).
+"""
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
+from postgrest.exceptions import APIError
+
+from src.scheduler.scheduler import _JOB_COLUMNS, ScheduledJob, Scheduler
+
+
+def _frozen_now(moment):
+    """Patch the scheduler's clock so datetime.now() returns ``moment``."""
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment
+
+    return patch("src.scheduler.scheduler.datetime", _FrozenDatetime)
+
+
+def _job(**overrides):
+    """Build a weekly ScheduledJob with required fields filled in."""
+    fields = {
+        "client_id": uuid4(),
+        "business_name": "Test Bistro",
+        "location": "London, UK",
+        "owner_email": "owner@example.com",
+        "frequency": "weekly",
+        "schedule_day": "wednesday",
+        "schedule_hour": 9,
+    }
+    fields.update(overrides)
+    return ScheduledJob(**fields)
+
+
+class TestCronTrigger:
+    """Tests for building APScheduler triggers."""
+
+    def test_trigger_built_once(self):
+        """Test the trigger is cached on the job."""
+        job = _job()
+
+        assert job.get_cron_trigger() is job.get_cron_trigger()
+        assert job.cron_trigger is job.get_cron_trigger()
+
+    def test_schedule_day_change_rebuilds_trigger(self):
+        """Test reassigning schedule_day invalidates the cached trigger."""
+        job = _job()
+        trigger = job.cron_trigger
+
+        job.business_name = "Renamed Bistro"
+        assert job.cron_trigger is trigger
+
+        job.schedule_day = "friday"
+        rebuilt = job.cron_trigger
+
+        assert rebuilt is not trigger
+        assert {f.name: str(f) for f in rebuilt.fields}["day_of_week"] == "4"
+
+    def test_weekly_trigger_fields(self):
+        """Test a weekly trigger fires on the scheduled day and hour."""
+        trigger = _job().cron_trigger
+
+        fields = {f.name: str(f) for f in trigger.fields}
+        assert fields["day_of_week"] == "2"
+        assert fields["hour"] == "9"
+        assert fields["minute"] == "0"
+
+    def test_unknown_frequency_raises(self):
+        """Test an unknown frequency is rejected."""
+        with pytest.raises(ValueError):
+            _job(frequency="hourly").cron_trigger
+
+
+class TestCalculateNextRun:
+    """Tests for next run calculation."""
+
+    def test_next_run_is_future_on_the_hour(self):
+        """Test the next run is in the future at the scheduled hour."""
+        for frequency in ("daily", "weekly", "monthly"):
+            next_run = _job(frequency=frequency).calculate_next_run()
+
+            assert next_run > datetime.now(timezone.utc)
+            assert (next_run.hour, next_run.minute, next_run.second) == (9, 0, 0)
+
+    def test_weekly_next_run_on_scheduled_day(self):
+        """Test a weekly job lands on its day, including after reassignment."""
+        job = _job()
+        assert job.calculate_next_run().weekday() == 2
+
+        job.schedule_day = "friday"
+        assert job.calculate_next_run().weekday() == 4
+
+    def test_weekly_without_day_defaults_to_monday(self):
+        """Test a weekly job with no day falls back to Monday."""
+        assert _job(schedule_day=None).calculate_next_run().weekday() == 0
+
+    def test_monthly_rolls_over_year_end(self):
+        """Test a December monthly job moves to 1 January of the next year."""
+        with _frozen_now(datetime(2024, 12, 15, 12, 30, tzinfo=timezone.utc)):
+            next_run = _job(frequency="monthly").calculate_next_run()
+
+        assert next_run == datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+
+    def test_daily_after_hour_moves_to_tomorrow(self):
+        """Test a daily job whose hour has passed runs the next day."""
+        with _frozen_now(datetime(2024, 2, 29, 9, 0, 1, tzinfo=timezone.utc)):
+            next_run = _job(frequency="daily").calculate_next_run()
+
+        assert next_run == datetime(2024, 3, 1, 9, tzinfo=timezone.utc)
+
+
+class TestSerialization:
+    """Tests for converting jobs to and from Supabase rows."""
+
+    def test_round_trip(self):
+        """Test a job survives a to_dict/from_dict round trip."""
+        job = _job(last_run=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc))
+
+        restored = ScheduledJob.from_dict(job.to_dict())
+
+        assert restored.id == job.id
+        assert restored.client_id == job.client_id
+        assert restored.last_run == job.last_run
+        assert restored.next_run is None
+        assert restored.created_at == job.created_at
+
+    def test_id_strings_follow_assignment(self):
+        """Test reassigned IDs are the ones written by to_dict."""
+        job = _job()
+        job.to_dict()
+
+        job.id = uuid4()
+        job.client_id = uuid4()
+        data = job.to_dict()
+
+        assert data["id"] == str(job.id)
+        assert data["client_id"] == str(job.client_id)
+
+    def test_iso_strings_follow_assignment(self):
+        """Test to_dict writes the current run time, formatted when called."""
+        job = _job()
+        assert job.to_dict()["next_run"] is None
+
+        job.next_run = datetime(2024, 1, 17, 9, 0, tzinfo=timezone.utc)
+
+        assert job.to_dict()["next_run"] == "2024-01-17T09:00:00+00:00"
+
+    def test_supabase_timestamps_parsed(self):
+        """Test timestamptz strings from Supabase become aware datetimes."""
+        row = _job().to_dict()
+        row.update(id=None, next_run="2024-01-17T09:00:00+00:00", created_at="")
+
+        restored = ScheduledJob.from_dict(row)
+
+        assert restored.next_run == datetime(2024, 1, 17, 9, 0, tzinfo=timezone.utc)
+        assert restored.id is not None
+        assert restored.created_at.tzinfo is not None
+
+
+def _scheduler_with(supabase):
+    """Build a Scheduler wired to a mock Supabase client."""
+    scheduler = Scheduler(supabase_url="https://test.supabase.co", supabase_key="test-key")
+    scheduler._supabase = supabase
+    return scheduler
+
+
+class TestSupabasePool:
+    """Tests for the scheduler's pooled Supabase HTTP client."""
+
+    async def test_queries_share_pooled_client_closed_on_stop(self):
+        """Test PostgREST uses the pooled client and stop() closes it."""
+        scheduler = Scheduler(supabase_url="https://test.supabase.co", supabase_key="test-key")
+
+        client = scheduler._get_supabase()
+        http = scheduler._http
+
+        assert client.postgrest.session is http
+        assert scheduler._get_supabase() is client
+
+        scheduler._is_running = True
+        await scheduler.stop()
+
+        assert http.is_closed
+        assert scheduler._supabase is None
+
+
+class TestSupabaseOffload:
+    """Tests for running Supabase calls off the event loop."""
+
+    async def test_execute_runs_in_worker_thread(self):
+        """Test queries execute on a thread other than the event loop's."""
+        threads = []
+        supabase = MagicMock()
+        query = supabase.table.return_value.select.return_value.eq.return_value
+
+        def execute():
+            threads.append(threading.get_ident())
+            return MagicMock(data=[])
+
+        query.execute.side_effect = execute
+
+        assert await _scheduler_with(supabase).get_job(uuid4()) is None
+        assert threads and threads[0] != threading.get_ident()
+
+    async def test_selects_only_job_columns(self):
+        """Test reads request exactly the columns a ScheduledJob round-trips."""
+        supabase = MagicMock()
+        select = supabase.table.return_value.select
+        select.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+
+        await _scheduler_with(supabase).get_job(uuid4())
+
+        select.assert_called_once_with(_JOB_COLUMNS)
+        assert set(_JOB_COLUMNS.split(",")) == set(_job().to_dict())
+
+    async def test_list_jobs_parses_rows(self):
+        """Test listed rows come back as ScheduledJob instances."""
+        row = _job().to_dict()
+        supabase = MagicMock()
+        query = supabase.table.return_value.select.return_value.order.return_value
+        query.execute.return_value = MagicMock(data=[row])
+
+        jobs = await _scheduler_with(supabase).list_scheduled_jobs()
+
+        assert [str(job.id) for job in jobs] == [row["id"]]
+
+
+class TestScheduleClient:
+    """Tests for creating a client's scheduled job."""
+
+    async def test_inserts_without_existence_check(self):
+        """Test a new client costs one insert and no prior select."""
+        supabase = MagicMock()
+
+        job = await _scheduler_with(supabase).schedule_client(
+            client_id=uuid4(),
+            business_name="Test Bistro",
+            location="London, UK",
+            email="owner@example.com",
+        )
+
+        insert = supabase.table.return_value.insert
+        insert.assert_called_once_with(job.to_dict())
+        insert.return_value.execute.assert_called_once()
+        supabase.table.return_value.select.assert_not_called()
+
+    async def test_duplicate_client_raises_value_error(self):
+        """Test a unique violation on client_id becomes a ValueError."""
+        supabase = MagicMock()
+        supabase.table.return_value.insert.return_value.execute.side_effect = APIError(
+            {"code": "23505", "message": "duplicate key value violates unique constraint"}
+        )
+
+        with pytest.raises(ValueError, match="already has a scheduled job"):
+            await _scheduler_with(supabase).schedule_client(
+                client_id=uuid4(),
+                business_name="Test Bistro",
+                location="London, UK",
+                email="owner@example.com",
+            )
+
+    async def test_other_api_errors_propagate(self):
+        """Test non-conflict API errors are re-raised unchanged."""
+        supabase = MagicMock()
+        supabase.table.return_value.insert.return_value.execute.side_effect = APIError(
+            {"code": "42501", "message": "permission denied"}
+        )
+
+        with pytest.raises(APIError):
+            await _scheduler_with(supabase).schedule_client(
+                client_id=uuid4(),
+                business_name="Test Bistro",
+                location="London, UK",
+                email="owner@example.com",
+            )
+
+
+class TestLoadJobs:
+    """Tests for loading active jobs into APScheduler."""
+
+    async def test_batch_load_and_replace(self):
+        """Test loaded jobs are registered once each and processing resumes."""
+        rows = [_job().to_dict(), _job().to_dict()]
+        supabase = MagicMock()
+        query = supabase.table.return_value.select.return_value.eq.return_value
+        query.execute.return_value = MagicMock(data=rows)
+        scheduler = _scheduler_with(supabase)
+        scheduler._scheduler = AsyncIOScheduler()
+        scheduler._scheduler.start()
+
+        try:
+            await scheduler._load_jobs_from_supabase()
+            # Re-adding a loaded job replaces it rather than duplicating it
+            scheduler._add_job_to_scheduler(ScheduledJob.from_dict(rows[0]))
+
+            assert scheduler._scheduler.state == STATE_RUNNING
+            assert sorted(job.id for job in scheduler._scheduler.get_jobs()) == sorted(
+                f"job_{row['client_id']}" for row in rows
+            )
+        finally:
+            scheduler._scheduler.shutdown(wait=False)
@@ -0,0 +1,184 @@
+"""Unit tests for core entity models.
+
+Tests conversion to and from Neo4j properties and database rows.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.schemas import AnalysisReport, Business, PriceRange, Review
+
+
+def _business(**overrides):
+    """Build a Business with required fields filled in."""
+    fields = {
+        "name": "Test Bistro",
+        "address": "1 Main St",
+        "city": "London",
+        "postcode": "E1 1AA",
+        "price_range": PriceRange.MODERATE,
+    }
+    fields.update(overrides)
+    return Business(**fields)
+
+
+def _report(**overrides):
+    """Build an AnalysisReport with required fields filled in."""
+    now = datetime(2024, 1, 15, 12, 0, 0)
+    fields = {
+        "business_id": uuid4(),
+        "report_date": now,
+        "period_start": now,
+        "period_end": now,
+        "summary": "Steady week",
+        "sentiment_trend": {"week_1": 0.5},
+        "top_themes": [{"theme": "food", "count": 3}],
+    }
+    fields.update(overrides)
+    return AnalysisReport(**fields)
+
+
+class TestEntityConfig:
+    """Tests for shared entity configuration."""
+
+    def test_entities_are_frozen(self):
+        """Test entities reject mutation and can be hashed."""
+        business = _business()
+
+        with pytest.raises(ValidationError):
+            business.name = "Renamed"
+
+        assert business.model_copy(update={"name": "Renamed"}).name == "Renamed"
+        assert hash(business) == hash(business)
+
+
+class TestToNeo4jProperties:
+    """Tests for converting entities to Neo4j node properties."""
+
+    def test_scalar_types_converted(self):
+        """Test UUID, datetime and enum values become primitives."""
+        business = _business()
+
+        props = business.to_neo4j_properties()
+
+        assert props["id"] == str(business.id)
+        assert props["created_at"] == business.created_at.isoformat()
+        assert props["price_range"] == "$$"
+
+    def test_none_values_dropped(self):
+        """Test unset optional fields are not written as properties."""
+        props = _business().to_neo4j_properties()
+
+        assert "phone" not in props
+        assert "website" not in props
+
+    def test_report_nested_fields_serialized_as_json(self):
+        """Test nested structures are stored as JSON strings."""
+        report = _report()
+
+        props = report.to_neo4j_properties()
+
+        assert json.loads(props["sentiment_trend"]) == {"week_1": 0.5}
+        assert json.loads(props["top_themes"]) == [{"theme": "food", "count": 3}]
+
+    def test_report_json_fields_use_json_mode_values(self):
+        """Test every nested report field is a JSON string of JSON-mode values."""
+        report = _report(recommendations=["Add a lunch menu"])
+
+        props = report.to_neo4j_properties()
+
+        assert json.loads(props["recommendations"]) == ["Add a lunch menu"]
+        assert json.loads(props["competitor_comparison"]) == {}
+
+
+    def test_batch_properties_match_per_entity_conversion(self):
+        """Test batch conversion yields each entity's own properties in order."""
+        businesses = [_business(name="First"), _business(name="Second")]
+
+        rows = Business.to_neo4j_batch_properties(businesses)
+
+        assert rows == [b.to_neo4j_properties() for b in businesses]
+        assert [row["name"] for row in rows] == ["First", "Second"]
+
+
+class TestFromNeo4jNode:
+    """Tests for hydrating entities from Neo4j node properties."""
+
+    def test_decoders_built_per_class(self):
+        """Test each subclass gets converters for its own UUID/datetime/enum fields."""
+        assert set(Review._neo4j_decoders) == {
+            "id",
+            "business_id",
+            "platform",
+            "review_date",
+            "created_at",
+        }
+        assert "review_date" not in Business._neo4j_decoders
+
+    def test_report_json_fields_decoded_per_class(self):
+        """Test a report's JSON fields get converters without per-row overrides."""
+        assert set(AnalysisReport._JSON_FIELDS) <= set(AnalysisReport._neo4j_decoders)
+        assert set(AnalysisReport._JSON_FIELDS) == set(AnalysisReport._neo4j_encoders)
+
+    def test_business_round_trip(self):
+        """Test a business survives a Neo4j round trip."""
+        business = _business()
+
+        restored = Business.from_neo4j_node(business.to_neo4j_properties())
+
+        assert restored == business
+        assert isinstance(restored.id, UUID)
+
+    def test_report_round_trip(self):
+        """Test JSON fields are parsed back into Python structures."""
+        report = _report()
+
+        restored = AnalysisReport.from_neo4j_node(report.to_neo4j_properties())
+
+        assert restored == report
+
+    def test_trusted_round_trip_skips_validation(self):
+        """Test trusted hydration builds an equal model without validating."""
+        business = _business()
+
+        with patch.object(Business, "model_validate") as validate:
+            restored = Business.from_neo4j_node(business.to_neo4j_properties(), trusted=True)
+
+        validate.assert_not_called()
+        assert restored == business
+        assert restored.price_range is PriceRange.MODERATE
+
+    def test_trusted_report_round_trip(self):
+        """Test trusted hydration still parses the report's JSON fields."""
+        report = _report()
+
+        restored = AnalysisReport.from_neo4j_node(report.to_neo4j_properties(), trusted=True)
+
+        assert restored == report
+
+
+class TestToDbRow:
+    """Tests for converting entities to database rows."""
+
+    def test_review_row_is_primitive(self):
+        """Test database rows hold only JSON-compatible values."""
+        review = Review(
+            business_id=uuid4(),
+            platform="google",
+            author_name="Sam",
+            text="Great food",
+            rating=4.5,
+            review_date=datetime(2024, 1, 15),
+        )
+
+        row = review.to_db_row()
+
+        assert row["business_id"] == str(review.business_id)
+        assert row["platform"] == "google"
+        assert row["review_date"] == "2024-01-15T00:00:00"
+        assert row["themes"] is None